@@ -2,33 +2,109 @@
 CameraFactory - Creates the appropriate camera backend based on Settings
 This allows seamless switching between ZED and RealSense cameras
 """
+import concurrent.futures
+import functools
+import importlib.util
+import sys
+import threading
+import types
+
 import Settings as s
 
+# Registry of supported backends: camera_type -> (module name, class name)
+# Adding a new camera is a one-line entry here, no dispatch logic to edit
+_BACKENDS = {
+    "zed": ("Camera_zed", "Camera"),
+    "realsense": ("Camera_realsense", "RealsenseNew"),
+}
+
+
+def _lazy_module(name):
+    """
+    Import a module lazily: the module object exists right away but its body
+    (and the heavy pyzed/pyrealsense2/mediapipe imports it pulls in) only runs
+    on first attribute access
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
 
+@functools.cache
+def _get_backend_cls(kind):
+    """Resolve (and cache) the camera class for a backend kind - the import runs only once"""
+    try:
+        module_name, class_name = _BACKENDS[kind]
+    except KeyError:
+        raise ValueError(f"❌ Unknown camera_type: '{kind}'. Must be one of {sorted(_BACKENDS)}") from None
+
+    print(f"🎥 Initializing {kind} Camera...")
+    return getattr(_lazy_module(module_name), class_name)
+
+
+# Future holding the camera being built by prewarm(), None if prewarm wasn't used
+_prewarm_future = None
+
+
+def prewarm():
+    """
+    Start building the camera on a background daemon thread so the multi-second
+    SDK/pipeline initialization overlaps with the rest of app startup.
+    Call as early as possible in main(); create_camera() will then just wait
+    for (or immediately return) the prewarmed instance.
+    """
+    global _prewarm_future
+    if _prewarm_future is not None:
+        return _prewarm_future
+
+    future = concurrent.futures.Future()
+
+    def _build():
+        try:
+            future.set_result(create_camera_uncached())
+        except BaseException as e:
+            future.set_exception(e)
+
+    _prewarm_future = future
+    threading.Thread(target=_build, daemon=True, name="camera-prewarm").start()
+    return future
+
+
+@functools.lru_cache(maxsize=1)
 def create_camera():
     """
     Factory function to create the appropriate camera object based on Settings.camera_type
+    The camera is constructed exactly once and reused - starting a hardware pipeline can
+    take several seconds, so repeated calls must not re-initialize the device.
     Returns: Camera object (either Camera for ZED or Realsense for RealSense)
     """
-    if s.camera_type == "zed":
-        print(f"🎥 Initializing ZED Camera...")
-        from Camera_zed import Camera
-        return Camera()
-    
-    elif s.camera_type == "realsense":
-        print(f"🎥 Initializing RealSense Camera...")
-        from Camera_realsense import RealsenseNew
-        return RealsenseNew()
-    
-    else:
-        raise ValueError(f"❌ Unknown camera_type: '{s.camera_type}'. Must be 'zed' or 'realsense'")
+    if _prewarm_future is not None:
+        return _prewarm_future.result()
+    return create_camera_uncached()
+
+
+def create_camera_uncached():
+    """Always construct a fresh camera object (for callers that really need a new pipeline)"""
+    return _get_backend_cls(s.camera_type)()
+
+
+# Static camera descriptions, built once at import time (read-only views so
+# callers cannot mutate the shared dicts). Unknown camera_type fails fast with
+# a KeyError instead of silently reporting "Intel RealSense"
+_CAMERA_INFO = {
+    "zed": types.MappingProxyType(
+        {"type": "zed", "name": "ZED Camera", "backend": "PyZedWrapper"}),
+    "realsense": types.MappingProxyType(
+        {"type": "realsense", "name": "Intel RealSense", "backend": "MediaPipe"}),
+}
 
 
 def get_camera_info():
     """Returns information about the current camera configuration"""
-    return {
-        "type": s.camera_type,
-        "name": "ZED Camera" if s.camera_type == "zed" else "Intel RealSense",
-        "backend": "PyZedWrapper" if s.camera_type == "zed" else "MediaPipe"
-    }
-
+    return _CAMERA_INFO[s.camera_type]
@@ -3,6 +3,9 @@ RealsenseNew.py - RealSense Camera Integration with Advanced Angle Calculation
 This version matches Camera.py's calculation logic for consistency across both camera types.
 """
 
+import functools
+import math
+import queue
 import threading
 import socket
 import time
@@ -11,7 +14,179 @@ from Audio import say, get_wav_duration
 from Joint import Joint
 from MP import MP
 import Settings as s
-import Excel
+
+
+def _angle3(ax, ay, az, bx, by, bz, cx, cy, cz):
+    """
+    Scalar 3D angle kernel: angle (in degrees) at point b between points a and c.
+    Works on nine plain floats so the per-frame callers never allocate ndarrays.
+    """
+    bax = ax - bx
+    bay = ay - by
+    baz = az - bz
+    bcx = cx - bx
+    bcy = cy - by
+    bcz = cz - bz
+
+    dot = bax * bcx + bay * bcy + baz * bcz
+    na2 = bax * bax + bay * bay + baz * baz
+    nc2 = bcx * bcx + bcy * bcy + bcz * bcz
+    # One sqrt of the product instead of sqrt(na2)*sqrt(nc2)
+    cosine_angle = dot / math.sqrt(na2 * nc2)
+
+    # ✅ Clamp cosine value between -1 and 1 to prevent domain errors
+    cosine_angle = min(1.0, max(-1.0, cosine_angle))
+
+    angle = math.degrees(math.acos(cosine_angle))
+
+    # ✅ Handle cases where the angle might get stuck at 180° due to straight alignment
+    if cosine_angle <= -0.999:
+        angle -= 0.1  # Small shift to prevent it from sticking
+
+    return angle
+
+
+# float32 scalars used by the batch kernel (avoid per-call construction)
+_F32_ONE = np.float32(1.0)
+_F32_NEG_ONE = np.float32(-1.0)
+_F32_COS_STUCK = np.float32(-0.999)
+_F32_NUDGE = np.float32(0.1)
+
+
+def _calc_angles_batch(A, B, C):
+    """
+    Vectorized counterpart of _angle3: A, B, C are (N, 3) coordinate arrays,
+    returns the N angles at B in degrees. One batch of ufunc calls replaces N
+    separate kernel invocations per frame. Undefined angles come back as NaN.
+    """
+    BA = A - B
+    BC = C - B
+    dot = np.einsum('ij,ij->i', BA, BC)
+    norm2 = np.einsum('ij,ij->i', BA, BA) * np.einsum('ij,ij->i', BC, BC)
+    # float32 constants keep the whole pipeline in float32; Python float
+    # literals would upcast every intermediate to float64 on older numpy
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cos = np.clip(dot / np.sqrt(norm2), _F32_NEG_ONE, _F32_ONE)
+    angles = np.degrees(np.arccos(cos))
+    # Same stuck-at-180° nudge as the scalar kernel
+    angles[cos <= _F32_COS_STUCK] -= _F32_NUDGE
+    return angles
+
+
+def _check_phase_bounds(angles, bounds_up, bounds_down):
+    """
+    Evaluate both phase predicates of a rep in one vectorized pass.
+
+    angles is the per-frame list from calc_angles_for_triples; bounds_up and
+    bounds_down are (N, 2) lower/upper-bound arrays in the same row order.
+    Returns (up_ok, down_ok) - both False when any angle is undefined.
+    """
+    for a in angles:
+        if a is None:
+            return False, False
+    arr = np.asarray(angles, dtype=np.float32)
+    up_ok = bool(((bounds_up[:, 0] < arr) & (arr < bounds_up[:, 1])).all())
+    down_ok = bool(((bounds_down[:, 0] < arr) & (arr < bounds_down[:, 1])).all())
+    return up_ok, down_ok
+
+
+# Smoothing-slot ids for the batched exercise loops, in batch row order.
+# Slots index into the preallocated previous_angles array (NaN = empty), so
+# smoothing costs one array read/write instead of two dict operations
+_SLOT_IDX = {"R_1": 0, "L_1": 1, "R_2": 2, "L_2": 3, "R_3": 4, "L_3": 5,
+             "default": 6, "calibration": 7}
+_SLOTS_TWO = (0, 1, 2, 3)
+_SLOTS_THREE = (0, 1, 2, 3, 4, 5)
+
+# MediaPipe landmark names in the order MP.py emits them. The skeleton is kept
+# as one (J, 3) float32 array (structure-of-arrays) with this row order, so a
+# frame costs zero Joint-object allocations on the exercise hot path
+_JOINT_ORDER = (
+    'nose',
+    'L_eye_inner', 'L_eye', 'L_eye_outer',
+    'R_eye_inner', 'R_eye', 'R_eye_outer',
+    'L_ear', 'R_ear', 'L_mouth', 'R_mouth',
+    'L_shoulder', 'R_shoulder', 'L_elbow', 'R_elbow',
+    'L_wrist', 'R_wrist',
+    'L_hand_pinky', 'R_hand_pinky', 'L_hand_index', 'R_hand_index',
+    'L_hand_thumb', 'R_hand_thumb', 'L_hip', 'R_hip',
+)
+_JOINT_IDX = {name: i for i, name in enumerate(_JOINT_ORDER)}
+
+
+def _triples_to_idx(name_triples):
+    """Translate joint-name triples to a (N, 3) int32 skeleton row-index table"""
+    return np.array([[_JOINT_IDX[n] for n in triple] for triple in name_triples],
+                    dtype=np.int32)
+
+
+@functools.lru_cache(maxsize=None)
+def _two_angle_tables(joint1, joint2, joint3, joint4, joint5, joint6,
+                      up_lb, up_ub, down_lb, down_ub, up_lb2, up_ub2, down_lb2, down_ub2,
+                      use_alternate_angles, left_right_differ):
+    """
+    Build (and cache per exercise signature) the constant tables a two-angle
+    exercise needs: the R_/L_ joint names, the skeleton row-index table and the
+    per-phase bounds arrays. Repeat sessions of the same exercise reuse them.
+    """
+    r1, r2, r3 = "R_" + joint1, "R_" + joint2, "R_" + joint3
+    l1, l2, l3 = "L_" + joint1, "L_" + joint2, "L_" + joint3
+    r4, r5, r6 = "R_" + joint4, "R_" + joint5, "R_" + joint6
+    l4, l5, l6 = "L_" + joint4, "L_" + joint5, "L_" + joint6
+    if use_alternate_angles:
+        name_triples = ((r1, r2, r3), (l1, l2, l3), (r4, r5, l6), (l4, l5, r6))
+    else:
+        name_triples = ((r1, r2, r3), (l1, l2, l3), (r4, r5, r6), (l4, l5, l6))
+    triples_idx = _triples_to_idx(name_triples)
+
+    # left_right_differ mirrors the left-side rows so one vectorized check
+    # covers both variants
+    if left_right_differ:
+        bounds_up = np.array([[up_lb, up_ub], [down_lb, down_ub],
+                              [up_lb2, up_ub2], [down_lb2, down_ub2]], dtype=np.float32)
+        bounds_down = np.array([[down_lb, down_ub], [up_lb, up_ub],
+                                [down_lb2, down_ub2], [up_lb2, up_ub2]], dtype=np.float32)
+    else:
+        bounds_up = np.array([[up_lb, up_ub], [up_lb, up_ub],
+                              [up_lb2, up_ub2], [up_lb2, up_ub2]], dtype=np.float32)
+        bounds_down = np.array([[down_lb, down_ub], [down_lb, down_ub],
+                                [down_lb2, down_ub2], [down_lb2, down_ub2]], dtype=np.float32)
+
+    return (r1, r2, r3, l1, l2, l3, r4, r5, r6, l4, l5, l6), triples_idx, bounds_up, bounds_down
+
+
+@functools.lru_cache(maxsize=None)
+def _three_angle_tables(joint1, joint2, joint3, joint4, joint5, joint6, joint7, joint8, joint9,
+                        up_lb, up_ub, down_lb, down_ub, up_lb2, up_ub2, down_lb2, down_ub2,
+                        up_lb3, up_ub3, down_lb3, down_ub3, use_alternate_angles):
+    """Cached constant tables for a three-angle exercise (see _two_angle_tables)"""
+    if use_alternate_angles:
+        third_pair = (("R_" + joint7, "R_" + joint8, "L_" + joint9),
+                      ("L_" + joint7, "L_" + joint8, "R_" + joint9))
+    else:
+        third_pair = (("R_" + joint7, "R_" + joint8, "R_" + joint9),
+                      ("L_" + joint7, "L_" + joint8, "L_" + joint9))
+    name_triples = (("R_" + joint1, "R_" + joint2, "R_" + joint3),
+                    ("L_" + joint1, "L_" + joint2, "L_" + joint3),
+                    ("R_" + joint4, "R_" + joint5, "R_" + joint6),
+                    ("L_" + joint4, "L_" + joint5, "L_" + joint6)) + third_pair
+    triples_idx = _triples_to_idx(name_triples)
+
+    bounds_up = np.array([[up_lb, up_ub], [up_lb, up_ub],
+                          [up_lb2, up_ub2], [up_lb2, up_ub2],
+                          [up_lb3, up_ub3], [up_lb3, up_ub3]], dtype=np.float32)
+    bounds_down = np.array([[down_lb, down_ub], [down_lb, down_ub],
+                            [down_lb2, down_ub2], [down_lb2, down_ub2],
+                            [down_lb3, down_ub3], [down_lb3, down_ub3]], dtype=np.float32)
+
+    return triples_idx, bounds_up, bounds_down
+
+
+@functools.lru_cache(maxsize=None)
+def _one_angle_tables(joint1, joint2, joint3):
+    """Cached right/left row-index table for a single-angle exercise"""
+    return _triples_to_idx((("R_" + joint1, "R_" + joint2, "R_" + joint3),
+                            ("L_" + joint1, "L_" + joint2, "L_" + joint3)))
 
 
 class RealsenseNew(threading.Thread):
@@ -20,22 +195,51 @@ class RealsenseNew(threading.Thread):
     Uses same angle calculation logic as ZED Camera for consistency
     """
 
+    # Row order of the skeleton array read_skeleton() returns, for consumers
+    # that want to resolve joint names to rows once and index directly
+    JOINT_NAMES = _JOINT_ORDER
+
     def __init__(self):
         threading.Thread.__init__(self)
         # Initialize UDP socket for receiving skeleton data from MediaPipe
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.server_address = ('localhost', 7000)
         self.sock.bind(self.server_address)
+        # Set the receive timeout once - settimeout is a syscall, so doing it
+        # per recvfrom would cost a kernel round-trip every frame
+        self.sock.settimeout(1)
         print("REALSENSE CAMERA INITIALIZATION")
         
-        # Angle tracking for smoothing
-        self.previous_angles = {}
+        # Angle tracking for smoothing - one float32 per slot (see _SLOT_IDX),
+        # NaN meaning "no previous angle yet"
+        self.previous_angles = np.full(len(_SLOT_IDX), np.nan, dtype=np.float32)
         self.max_angle_jump = 10  # Maximum degrees an angle can jump per frame
+
+        # Preallocated skeleton buffer, one row per landmark (see _JOINT_ORDER)
+        self.skel = np.zeros((len(_JOINT_ORDER), 3), dtype=np.float32)
+
+        # Rep-count speech goes through a small queue drained by a dedicated
+        # worker thread, so the tracking loop never blocks on audio playback
+        self._tts_queue = queue.Queue(maxsize=8)
+        threading.Thread(target=self._tts_worker, daemon=True, name="camera-tts").start()
         
         # Frame tracking
         self.frame_count = 0
         self.start_time = None
 
+    def _tts_worker(self):
+        """Speak queued texts one at a time off the tracking thread"""
+        while True:
+            say(self._tts_queue.get())
+
+    def say_async(self, text):
+        """Queue text for speech without blocking; drop it if the queue is full
+        so a burst of reps cannot back up the tracking loop with stale counts"""
+        try:
+            self._tts_queue.put_nowait(text)
+        except queue.Full:
+            pass
+
     def calc_angle_3d(self, joint1, joint2, joint3, joint_name="default"):
         """
         Calculate 3D angle between three joints with smoothing and error prevention
@@ -48,82 +252,93 @@ class RealsenseNew(threading.Thread):
             joint_name: Identifier for angle tracking
             
         Returns:
-            Angle in degrees (rounded to 2 decimal places) or None if calculation fails
+            Angle in degrees or None if calculation fails
         """
-        a = np.array([joint1.x, joint1.y, joint1.z], dtype=np.float32)
-        b = np.array([joint2.x, joint2.y, joint2.z], dtype=np.float32)
-        c = np.array([joint3.x, joint3.y, joint3.z], dtype=np.float32)
-
-        ba = a - b  # Vector from joint2 to joint1
-        bc = c - b  # Vector from joint2 to joint3
-
         try:
-            # Compute cosine of the angle
-            cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
-
-            # ✅ Clamp cosine value between -1 and 1 to prevent NaN errors
-            cosine_angle = np.clip(cosine_angle, -1.0, 1.0)
-
-            # Convert to degrees
-            angle = np.degrees(np.arccos(cosine_angle))
-
-            # ✅ Handle cases where the angle might get stuck at 180° due to straight alignment
-            if np.isclose(cosine_angle, -1.0, atol=1e-3):
-                angle -= 0.1  # Small shift to prevent it from sticking
+            angle = _angle3(joint1.x, joint1.y, joint1.z,
+                            joint2.x, joint2.y, joint2.z,
+                            joint3.x, joint3.y, joint3.z)
 
             # ✅ Ensure angle smoothing to avoid sudden jumps
-            if joint_name in self.previous_angles:
-                angle = self.limit_angle_jump(angle, joint_name)
-
-            self.previous_angles[joint_name] = angle
-
-            return round(angle, 2)
+            slot = _SLOT_IDX.get(joint_name, _SLOT_IDX["default"])
+            return self.limit_angle_jump(angle, slot)
 
         except Exception as e:
             print(f"⚠️ Could not calculate the angle for {joint_name}: {e}")
             return None
 
-    def limit_angle_jump(self, angle, joint_name):
+    def limit_angle_jump(self, angle, slot):
         """
         Limit angle changes to prevent jittery movements
-        
+
         Args:
             angle: New calculated angle
-            joint_name: Identifier for which angle
-            
+            slot: Smoothing-slot id for which angle (see _SLOT_IDX)
+
         Returns:
-            Smoothed angle value
+            Smoothed angle value (also stored as the slot's new previous angle)
         """
-        previous_angle = self.previous_angles[joint_name]
-        if abs(angle - previous_angle) > self.max_angle_jump:
-            direction = 1 if angle > previous_angle else -1
-            angle = previous_angle + direction * self.max_angle_jump
+        previous_angle = self.previous_angles[slot]
+        if not math.isnan(previous_angle):
+            delta = angle - previous_angle
+            if abs(delta) > self.max_angle_jump:
+                angle = previous_angle + math.copysign(self.max_angle_jump, delta)
+        self.previous_angles[slot] = angle
         return angle
 
-    def get_skeleton_data(self):
+    def calc_angles_for_triples(self, skel, triples_idx, slots):
         """
-        Receive skeleton joint data from MediaPipe via UDP socket
-        
+        Compute all angles for one frame in a single vectorized batch.
+
+        Args:
+            skel: (J, 3) skeleton array for the frame (self.skel)
+            triples_idx: (N, 3) int array of skeleton row indices per angle
+            slots: smoothing-slot id per triple (e.g. _SLOTS_TWO)
+
         Returns:
-            Dictionary of joints {joint_name: Joint object} or None on timeout
+            List of angles (same order as triples_idx), None where undefined
+        """
+        A = skel[triples_idx[:, 0]]
+        B = skel[triples_idx[:, 1]]
+        C = skel[triples_idx[:, 2]]
+
+        angles = _calc_angles_batch(A, B, C)
+
+        result = []
+        for raw, slot in zip(angles, slots):
+            if np.isnan(raw):
+                result.append(None)
+                continue
+            result.append(self.limit_angle_jump(float(raw), slot))
+        return result
+
+    def read_skeleton(self):
+        """
+        Receive one binary skeleton frame from MediaPipe via UDP and parse it
+        into the preallocated (J, 3) float32 array - no per-frame Joint objects
+
+        Returns:
+            The shared self.skel ndarray, or None on timeout/parse error
         """
-        self.sock.settimeout(1)
         try:
             data, address = self.sock.recvfrom(4096)
-            data = data.decode()  # Decode bytes to string
-            data = data.split('/')  # Split by '/' separator
-            joints_str = []
-            for i in data:
-                if i:  # Skip empty strings
-                    joint_data = i.split(',')
-                    joints_str.append(joint_data)
-            
-            # Parse joints
-            joints = {}
-            for j in joints_str:
-                if len(j) == 4:  # Ensure we have name, x, y, z
-                    joints[j[0]] = Joint(j[0], float(j[1]), float(j[2]), float(j[3]) * 100)
-            return joints
+            # Drain any backlog and keep only the newest datagram, so rep
+            # detection never chews through stale poses one frame at a time
+            self.sock.setblocking(False)
+            try:
+                while True:
+                    data, address = self.sock.recvfrom(4096)
+            except BlockingIOError:
+                pass
+            finally:
+                self.sock.settimeout(1)
+            skel = self.skel
+            # One C-level parse of the fixed-order binary frame (see MP.py's
+            # sender) - no string splitting or per-value float() calls
+            skel[:] = np.frombuffer(data, dtype='<f4',
+                                    count=skel.size).reshape(skel.shape)
+            skel[:, 2] *= 100  # depth arrives in meters-scale units
+            return skel
         except socket.timeout:
             print("Didn't receive data! [Timeout]")
             return None
@@ -131,6 +346,19 @@ class RealsenseNew(threading.Thread):
             print(f"Error parsing skeleton data: {e}")
             return None
 
+    def get_skeleton_data(self):
+        """
+        Receive skeleton joint data from MediaPipe via UDP socket
+
+        Returns:
+            Dictionary of joints {joint_name: Joint object} or None on timeout
+        """
+        skel = self.read_skeleton()
+        if skel is None:
+            return None
+        return {name: Joint(name, float(skel[row, 0]), float(skel[row, 1]), float(skel[row, 2]))
+                for name, row in _JOINT_IDX.items()}
+
     def run(self):
         """Main thread loop - handles exercise requests"""
         print("CAMERA START (RealSense)")
@@ -140,7 +368,6 @@ class RealsenseNew(threading.Thread):
         mediaPipe.start()
         
         while not s.finish_program:
-            time.sleep(0.0001)
             if s.req_exercise != "":
                 ex = s.req_exercise
                 print(f"CAMERA: Exercise {ex} start")
@@ -153,7 +380,11 @@ class RealsenseNew(threading.Thread):
                 s.req_exercise = ""
                 s.camera_done = True
             else:
-                time.sleep(1)
+                # Sleep until set_req_exercise() signals a new request; the
+                # timeout still catches writers that assign the string directly
+                with s.req_cv:
+                    while s.req_exercise == "" and not s.finish_program:
+                        s.req_cv.wait(timeout=1.0)
         print("Camera Done")
 
     # ==================== EXERCISE TRACKING METHODS ====================
@@ -164,80 +395,66 @@ class RealsenseNew(threading.Thread):
         """Track exercise with two angles (4 joints total)"""
         flag = True
         counter = 0
-        list_joints = []
         s.time_of_change_position = time.time()
-        
-        while s.req_exercise == exercise_name:
-            while s.did_training_paused and not s.stop_requested:
-                time.sleep(0.01)
-                if self.previous_angles != {}:
-                    self.previous_angles = {}
-        
-            joints = self.get_skeleton_data()
-            if joints is not None:
-                right_angle = self.calc_angle_3d(joints[str("R_" + joint1)], joints[str("R_" + joint2)],
-                                                 joints[str("R_" + joint3)], "R_1")
-                left_angle = self.calc_angle_3d(joints[str("L_" + joint1)], joints[str("L_" + joint2)],
-                                                joints[str("L_" + joint3)], "L_1")
-                
-                if use_alternate_angles:
-                    right_angle2 = self.calc_angle_3d(joints[str("R_" + joint4)], joints[str("R_" + joint5)],
-                                                     joints[str("L_" + joint6)], "R_2")
-                    left_angle2 = self.calc_angle_3d(joints[str("L_" + joint4)], joints[str("L_" + joint5)],
-                                                     joints[str("R_" + joint6)], "L_2")
-                else:
-                    right_angle2 = self.calc_angle_3d(joints[str("R_" + joint4)], joints[str("R_" + joint5)],
-                                                   joints[str("R_" + joint6)], "R_2")
-                    left_angle2 = self.calc_angle_3d(joints[str("L_" + joint4)], joints[str("L_" + joint5)],
-                                                  joints[str("L_" + joint6)], "L_2")
-
-                # Update UI information
-                if flag == False:
-                    s.information = [[str("R_" + joint1), str("R_" + joint2), str("R_" + joint3), up_lb, up_ub],
-                                     [str("L_" + joint1), str("L_" + joint2), str("L_" + joint3), up_lb, up_ub],
-                                     [str("R_" + joint4), str("R_" + joint5), str("R_" + joint6), up_lb2, up_ub2],
-                                     [str("L_" + joint4), str("L_" + joint5), str("L_" + joint6), up_lb2, up_ub2]]
-                else:
-                    s.information = [
-                        [str("R_" + joint1), str("R_" + joint2), str("R_" + joint3), down_lb, down_ub],
-                        [str("L_" + joint1), str("L_" + joint2), str("L_" + joint3), down_lb, down_ub],
-                        [str("R_" + joint4), str("R_" + joint5), str("R_" + joint6), down_lb2, down_ub2],
-                        [str("L_" + joint4), str("L_" + joint5), str("L_" + joint6), down_lb2, down_ub2]]
-
-                if right_angle is not None and left_angle is not None and right_angle2 is not None and left_angle2 is not None:
-                    # Check exercise completion
-                    if left_right_differ:
-                        if (up_lb < right_angle < up_ub) & (down_lb < left_angle < down_ub) & \
-                                (up_lb2 < right_angle2 < up_ub2) & (down_lb2 < left_angle2 < down_ub2) & (not flag):
-                            flag = True
-                            counter += 1
-                            s.number_of_repetitions_in_training += 1
-                            s.patient_repetitions_counting_in_exercise += 1
-                            print(f"counter: {counter}")
-                            say(str(counter))
-                        elif (down_lb < right_angle < down_ub) & (up_lb < left_angle < up_ub) & \
-                                (down_lb2 < right_angle2 < down_ub2) & (up_lb2 < left_angle2 < up_ub2) & (flag):
-                            flag = False
-                    else:
-                        if (up_lb < right_angle < up_ub) & (up_lb < left_angle < up_ub) & \
-                                (up_lb2 < right_angle2 < up_ub2) & (up_lb2 < left_angle2 < up_ub2) & (not flag):
-                            flag = True
-                            counter += 1
-                            s.number_of_repetitions_in_training += 1
-                            s.patient_repetitions_counting_in_exercise += 1
-                            print(f"counter: {counter}")
-                            say(str(counter))
-                        elif (down_lb < right_angle < down_ub) & (down_lb < left_angle < down_ub) & \
-                                (down_lb2 < right_angle2 < down_ub2) & (down_lb2 < left_angle2 < down_ub2) & (flag):
-                            flag = False
 
-            if counter == s.rep:
+        # Constant tables for this exercise signature, cached at module level
+        (r1, r2, r3, l1, l2, l3, r4, r5, r6, l4, l5, l6), triples_idx, bounds_up, bounds_down = \
+            _two_angle_tables(joint1, joint2, joint3, joint4, joint5, joint6,
+                              up_lb, up_ub, down_lb, down_ub, up_lb2, up_ub2, down_lb2, down_ub2,
+                              use_alternate_angles, left_right_differ)
+
+        # The UI rows are constant within a phase - build both variants once
+        # and swap the reference each frame instead of rebuilding the nested
+        # lists at frame rate
+        info_up = [[r1, r2, r3, up_lb, up_ub],
+                   [l1, l2, l3, up_lb, up_ub],
+                   [r4, r5, r6, up_lb2, up_ub2],
+                   [l4, l5, l6, up_lb2, up_ub2]]
+        info_down = [[r1, r2, r3, down_lb, down_ub],
+                     [l1, l2, l3, down_lb, down_ub],
+                     [r4, r5, r6, down_lb2, down_ub2],
+                     [l4, l5, l6, down_lb2, down_ub2]]
+
+        # Hot-loop locals: LOAD_FAST on these beats repeated attribute lookups
+        read_skeleton = self.read_skeleton
+        calc_angles = self.calc_angles_for_triples
+        rep_target = s.rep
+
+        while s.req_exercise == exercise_name:
+            if s.did_training_paused:
+                # Park on the resume event instead of polling at 100 Hz; the
+                # timeout keeps stop_requested responsive
+                self.previous_angles.fill(np.nan)
+                while s.did_training_paused and not s.stop_requested:
+                    s.training_resumed.wait(timeout=0.5)
+
+            skel = read_skeleton()
+            if skel is not None:
+                angles = calc_angles(skel, triples_idx, _SLOTS_TWO)
+
+                # Update UI information (down phase shows the up-bounds target
+                # and vice versa, matching the original per-frame rebuild)
+                s.information = info_down if flag else info_up
+
+                # Check exercise completion - both phase predicates in one pass
+                up_ok, down_ok = _check_phase_bounds(angles, bounds_up, bounds_down)
+                if (not flag) and up_ok:
+                    flag = True
+                    counter += 1
+                    s.number_of_repetitions_in_training += 1
+                    s.patient_repetitions_counting_in_exercise += 1
+                    s.rep_event.set()
+                    print(f"counter: {counter}")
+                    self.say_async(str(counter))
+                elif flag and down_ok:
+                    flag = False
+
+            if counter == rep_target:
                 s.req_exercise = ""
                 s.success_exercise = True
                 break
 
         s.ex_list.update({exercise_name: counter})
-        Excel.wf_joints(exercise_name, list_joints)
 
     def exercise_two_angles_3d_with_axis_check(self, exercise_name, joint1, joint2, joint3, up_lb, up_ub, down_lb, down_ub,
                                joint4, joint5, joint6, up_lb2, up_ub2, down_lb2, down_ub2, diff_size, 
@@ -245,68 +462,57 @@ class RealsenseNew(threading.Thread):
         """Track exercise with two angles plus axis distance check"""
         flag = True
         counter = 0
-        list_joints = []
         s.time_of_change_position = time.time()
-        
-        while s.req_exercise == exercise_name:
-            while s.did_training_paused and not s.stop_requested:
-                time.sleep(0.01)
-                if self.previous_angles != {}:
-                    self.previous_angles = {}
-        
-            joints = self.get_skeleton_data()
-            if joints is not None:
-                right_angle = self.calc_angle_3d(joints[str("R_" + joint1)], joints[str("R_" + joint2)],
-                                                 joints[str("R_" + joint3)], "R_1")
-                left_angle = self.calc_angle_3d(joints[str("L_" + joint1)], joints[str("L_" + joint2)],
-                                                joints[str("L_" + joint3)], "L_1")
-                
-                if use_alternate_angles:
-                    right_angle2 = self.calc_angle_3d(joints[str("R_" + joint4)], joints[str("R_" + joint5)],
-                                                      joints[str("L_" + joint6)], "R_2")
-                    left_angle2 = self.calc_angle_3d(joints[str("L_" + joint4)], joints[str("L_" + joint5)],
-                                                     joints[str("R_" + joint6)], "L_2")
-                else:
-                    right_angle2 = self.calc_angle_3d(joints[str("R_" + joint4)], joints[str("R_" + joint5)],
-                                                      joints[str("R_" + joint6)], "R_2")
-                    left_angle2 = self.calc_angle_3d(joints[str("L_" + joint4)], joints[str("L_" + joint5)],
-                                                     joints[str("L_" + joint6)], "L_2")
-
-                if right_angle is not None and left_angle is not None and right_angle2 is not None and left_angle2 is not None:
-                    if left_right_differ:
-                        if (up_lb < right_angle < up_ub) & (down_lb < left_angle < down_ub) & \
-                                (up_lb2 < right_angle2 < up_ub2) & (down_lb2 < left_angle2 < down_ub2) & \
-                                (abs(joints["L_shoulder"].x - joints["R_shoulder"].x) < 200) & (not flag):
-                            flag = True
-                            counter += 1
-                            s.number_of_repetitions_in_training += 1
-                            s.patient_repetitions_counting_in_exercise += 1
-                            print(f"counter: {counter}")
-                            say(str(counter))
-                        elif (down_lb < right_angle < down_ub) & (up_lb < left_angle < up_ub) & \
-                                (down_lb2 < right_angle2 < down_ub2) & (up_lb2 < left_angle2 < up_ub2) & \
-                                (abs(joints["L_shoulder"].x - joints["R_shoulder"].x) < 200) & (flag):
-                            flag = False
-                    else:
-                        if (up_lb < right_angle < up_ub) & (up_lb < left_angle < up_ub) & \
-                                (up_lb2 < right_angle2 < up_ub2) & (up_lb2 < left_angle2 < up_ub2) & (not flag):
-                            flag = True
-                            counter += 1
-                            s.number_of_repetitions_in_training += 1
-                            s.patient_repetitions_counting_in_exercise += 1
-                            print(f"counter: {counter}")
-                            say(str(counter))
-                        elif (down_lb < right_angle < down_ub) & (down_lb < left_angle < down_ub) & \
-                                (down_lb2 < right_angle2 < down_ub2) & (down_lb2 < left_angle2 < down_ub2) & (flag):
-                            flag = False
 
-            if counter == s.rep:
+        # Constant tables for this exercise signature, cached at module level
+        # (the joint-name strings are not needed here - no UI publishing)
+        _names, triples_idx, bounds_up, bounds_down = \
+            _two_angle_tables(joint1, joint2, joint3, joint4, joint5, joint6,
+                              up_lb, up_ub, down_lb, down_ub, up_lb2, up_ub2, down_lb2, down_ub2,
+                              use_alternate_angles, left_right_differ)
+        l_shoulder_row = _JOINT_IDX["L_shoulder"]
+        r_shoulder_row = _JOINT_IDX["R_shoulder"]
+
+        # Hot-loop locals: LOAD_FAST on these beats repeated attribute lookups
+        read_skeleton = self.read_skeleton
+        calc_angles = self.calc_angles_for_triples
+        rep_target = s.rep
+
+        while s.req_exercise == exercise_name:
+            if s.did_training_paused:
+                # Park on the resume event instead of polling at 100 Hz; the
+                # timeout keeps stop_requested responsive
+                self.previous_angles.fill(np.nan)
+                while s.did_training_paused and not s.stop_requested:
+                    s.training_resumed.wait(timeout=0.5)
+
+            skel = read_skeleton()
+            if skel is not None:
+                angles = calc_angles(skel, triples_idx, _SLOTS_TWO)
+
+                up_ok, down_ok = _check_phase_bounds(angles, bounds_up, bounds_down)
+                if left_right_differ:
+                    # The axis check applies to both phases of the mirrored variant
+                    shoulders_ok = abs(skel[l_shoulder_row, 0] - skel[r_shoulder_row, 0]) < 200
+                    up_ok = up_ok and shoulders_ok
+                    down_ok = down_ok and shoulders_ok
+                if (not flag) and up_ok:
+                    flag = True
+                    counter += 1
+                    s.number_of_repetitions_in_training += 1
+                    s.patient_repetitions_counting_in_exercise += 1
+                    s.rep_event.set()
+                    print(f"counter: {counter}")
+                    self.say_async(str(counter))
+                elif flag and down_ok:
+                    flag = False
+
+            if counter == rep_target:
                 s.req_exercise = ""
                 s.success_exercise = True
                 break
 
         s.ex_list.update({exercise_name: counter})
-        Excel.wf_joints(exercise_name, list_joints)
 
     def exercise_three_angles_3d(self, exercise_name, joint1, joint2, joint3, up_lb, up_ub, down_lb, down_ub,
                                joint4, joint5, joint6, up_lb2, up_ub2, down_lb2, down_ub2,
@@ -315,127 +521,130 @@ class RealsenseNew(threading.Thread):
         """Track exercise with three angles (6 joints total)"""
         flag = True
         counter = 0
-        list_joints = []
         s.time_of_change_position = time.time()
-        
+
+        # Constant tables for this exercise signature, cached at module level
+        triples_idx, bounds_up, bounds_down = \
+            _three_angle_tables(joint1, joint2, joint3, joint4, joint5, joint6,
+                                joint7, joint8, joint9,
+                                up_lb, up_ub, down_lb, down_ub, up_lb2, up_ub2, down_lb2, down_ub2,
+                                up_lb3, up_ub3, down_lb3, down_ub3, use_alternate_angles)
+
+        # Hot-loop locals: LOAD_FAST on these beats repeated attribute lookups
+        read_skeleton = self.read_skeleton
+        calc_angles = self.calc_angles_for_triples
+        rep_target = s.rep
+
         while s.req_exercise == exercise_name:
-            while s.did_training_paused and not s.stop_requested:
-                time.sleep(0.01)
-                if self.previous_angles != {}:
-                    self.previous_angles = {}
-        
-            joints = self.get_skeleton_data()
-            if joints is not None:
-                right_angle = self.calc_angle_3d(joints[str("R_" + joint1)], joints[str("R_" + joint2)],
-                                                 joints[str("R_" + joint3)], "R_1")
-                left_angle = self.calc_angle_3d(joints[str("L_" + joint1)], joints[str("L_" + joint2)],
-                                                joints[str("L_" + joint3)], "L_1")
-
-                right_angle2 = self.calc_angle_3d(joints[str("R_" + joint4)], joints[str("R_" + joint5)],
-                                                 joints[str("R_" + joint6)], "R_2")
-                left_angle2 = self.calc_angle_3d(joints[str("L_" + joint4)], joints[str("L_" + joint5)],
-                                                joints[str("L_" + joint6)], "L_2")
-
-                if use_alternate_angles:
-                    right_angle3 = self.calc_angle_3d(joints[str("R_" + joint7)], joints[str("R_" + joint8)],
-                                                      joints[str("L_" + joint9)], "R_3")
-                    left_angle3 = self.calc_angle_3d(joints[str("L_" + joint7)], joints[str("L_" + joint8)],
-                                                     joints[str("R_" + joint9)], "L_3")
-                else:
-                    right_angle3 = self.calc_angle_3d(joints[str("R_" + joint7)], joints[str("R_" + joint8)],
-                                                      joints[str("R_" + joint9)], "R_3")
-                    left_angle3 = self.calc_angle_3d(joints[str("L_" + joint7)], joints[str("L_" + joint8)],
-                                                     joints[str("L_" + joint9)], "L_3")
-
-                if right_angle is not None and left_angle is not None and \
-                        right_angle2 is not None and left_angle2 is not None and \
-                        right_angle3 is not None and left_angle3 is not None:
-
-                    if (up_lb < right_angle < up_ub) & (up_lb < left_angle < up_ub) & \
-                            (up_lb2 < right_angle2 < up_ub2) & (up_lb2 < left_angle2 < up_ub2) & \
-                            (up_lb3 < right_angle3 < up_ub3) & (up_lb3 < left_angle3 < up_ub3) & (not flag):
-                        flag = True
-                        counter += 1
-                        s.number_of_repetitions_in_training += 1
-                        s.patient_repetitions_counting_in_exercise += 1
-                        print(f"counter: {counter}")
-                        say(str(counter))
-                    elif (down_lb < right_angle < down_ub) & (down_lb < left_angle < down_ub) & \
-                            (down_lb2 < right_angle2 < down_ub2) & (down_lb2 < left_angle2 < down_ub2) & \
-                            (down_lb3 < right_angle3 < down_ub3) & (down_lb3 < left_angle3 < down_ub3) & (flag):
-                        flag = False
-
-            if counter == s.rep:
+            if s.did_training_paused:
+                # Park on the resume event instead of polling at 100 Hz; the
+                # timeout keeps stop_requested responsive
+                self.previous_angles.fill(np.nan)
+                while s.did_training_paused and not s.stop_requested:
+                    s.training_resumed.wait(timeout=0.5)
+
+            skel = read_skeleton()
+            if skel is not None:
+                angles = calc_angles(skel, triples_idx, _SLOTS_THREE)
+
+                up_ok, down_ok = _check_phase_bounds(angles, bounds_up, bounds_down)
+                if (not flag) and up_ok:
+                    flag = True
+                    counter += 1
+                    s.number_of_repetitions_in_training += 1
+                    s.patient_repetitions_counting_in_exercise += 1
+                    s.rep_event.set()
+                    print(f"counter: {counter}")
+                    self.say_async(str(counter))
+                elif flag and down_ok:
+                    flag = False
+
+            if counter == rep_target:
                 s.req_exercise = ""
                 s.success_exercise = True
                 break
 
         s.ex_list.update({exercise_name: counter})
-        Excel.wf_joints(exercise_name, list_joints)
 
     def exercise_one_angle_3d_by_sides(self, exercise_name, joint1, joint2, joint3, one_lb, one_ub, two_lb, two_ub, side):
         """Track exercise with one angle, checking position by side"""
         flag = True
         counter = 0
-        list_joints = []
         s.time_of_change_position = time.time()
-        
+
+        # Constant row-index table for this exercise signature, cached at module level
+        triples_idx = _one_angle_tables(joint1, joint2, joint3)
+
+        # Hot-loop locals: LOAD_FAST on these beats repeated attribute lookups
+        read_skeleton = self.read_skeleton
+        calc_angles = self.calc_angles_for_triples
+        rep_target = s.rep
+
         while s.req_exercise == exercise_name:
-            while s.did_training_paused and not s.stop_requested:
-                time.sleep(0.01)
-                if self.previous_angles != {}:
-                    self.previous_angles = {}
-            
-            joints = self.get_skeleton_data()
-            if joints is not None:
-                right_angle = self.calc_angle_3d(joints[str("R_" + joint1)], joints[str("R_" + joint2)],
-                                          joints[str("R_" + joint3)], "R_1")
-                left_angle = self.calc_angle_3d(joints[str("L_" + joint1)], joints[str("L_" + joint2)],
-                                         joints[str("L_" + joint3)], "L_1")
+            if s.did_training_paused:
+                # Park on the resume event instead of polling at 100 Hz; the
+                # timeout keeps stop_requested responsive
+                self.previous_angles.fill(np.nan)
+                while s.did_training_paused and not s.stop_requested:
+                    s.training_resumed.wait(timeout=0.5)
+
+            skel = read_skeleton()
+            if skel is not None:
+                right_angle, left_angle = calc_angles(skel, triples_idx, _SLOTS_TWO[:2])
+
+                r_wrist_x = skel[_JOINT_IDX["R_wrist"], 0]
+                r_wrist_y = skel[_JOINT_IDX["R_wrist"], 1]
+                l_wrist_x = skel[_JOINT_IDX["L_wrist"], 0]
+                l_wrist_y = skel[_JOINT_IDX["L_wrist"], 1]
+                r_shoulder_x = skel[_JOINT_IDX["R_shoulder"], 0]
+                l_shoulder_x = skel[_JOINT_IDX["L_shoulder"], 0]
+                nose_y = skel[_JOINT_IDX["nose"], 1]
 
                 if side == 'right':
                     if right_angle is not None and left_angle is not None:
-                        if (one_lb < right_angle < one_ub) & (joints[str("R_wrist")].x > joints[str("L_shoulder")].x + 50) & \
-                           (joints[str("nose")].y - 50 > joints[str("R_wrist")].y) & (not flag):
+                        if (not flag) and (one_lb < right_angle < one_ub) and (r_wrist_x > l_shoulder_x + 50) and \
+                           (nose_y - 50 > r_wrist_y):
                             flag = True
                             counter += 1
                             s.patient_repetitions_counting_in_exercise += 1
+                            s.rep_event.set()
                             s.number_of_repetitions_in_training += 1
                             print(f"counter: {counter}")
-                            say(str(counter))
-                        elif (two_lb < right_angle < two_ub) & (joints[str("R_wrist")].x < joints[str("L_shoulder")].x - 400) & (flag):
+                            self.say_async(str(counter))
+                        elif (flag) and (two_lb < right_angle < two_ub) and (r_wrist_x < l_shoulder_x - 400):
                             flag = False
                 else:
                     if right_angle is not None and left_angle is not None:
-                        if (one_lb < left_angle < one_ub) & (joints[str("R_shoulder")].x - 50 > joints[str("L_wrist")].x) & \
-                           (joints[str("nose")].y - 50 > joints[str("L_wrist")].y) & (not flag):
+                        if (not flag) and (one_lb < left_angle < one_ub) and (r_shoulder_x - 50 > l_wrist_x) and \
+                           (nose_y - 50 > l_wrist_y):
                             flag = True
                             counter += 1
                             s.number_of_repetitions_in_training += 1
                             s.patient_repetitions_counting_in_exercise += 1
+                            s.rep_event.set()
                             print(f"counter: {counter}")
-                            say(str(counter))
-                        elif (two_lb < left_angle < two_ub) & (joints[str("L_wrist")].x > joints[str("R_shoulder")].x + 400) & (flag):
+                            self.say_async(str(counter))
+                        elif (flag) and (two_lb < left_angle < two_ub) and (l_wrist_x > r_shoulder_x + 400):
                             flag = False
 
-            if counter == s.rep:
+            if counter == rep_target:
                 s.req_exercise = ""
                 s.success_exercise = True
                 break
 
         s.ex_list.update({exercise_name: counter})
-        Excel.wf_joints(exercise_name, list_joints)
 
     # ==================== EXERCISE DEFINITIONS ====================
 
     def hello_waving(self):
         """Check if the participant waved"""
+        read_skeleton = self.read_skeleton
         while s.req_exercise == "hello_waving":
-            joints = self.get_skeleton_data()
-            if joints is not None:
-                right_shoulder = joints[str("R_shoulder")]
-                right_wrist = joints[str("R_wrist")]
-                if right_shoulder.y < right_wrist.y != 0:
+            skel = read_skeleton()
+            if skel is not None:
+                right_shoulder_y = skel[_JOINT_IDX["R_shoulder"], 1]
+                right_wrist_y = skel[_JOINT_IDX["R_wrist"], 1]
+                if right_shoulder_y < right_wrist_y != 0:
                     s.waved_has_tool = True
                     s.req_exercise = ""
 
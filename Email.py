@@ -463,7 +463,7 @@ def data_creation_to_create_pdf():
         exercise_label_reversed = "שם התרגיל:"[::-1]
         exercise_equipment = f"{Excel.get_equipment(exercise_name)}"[::-1]
         equipment_label_reversed = "אביזר:"[::-1]
-        successful_reps_label = reverse_hebrew_sequence_in_text(f":מספר חזרות מוצלחות")
+        successful_reps_label = reverse_hebrew_sequence_in_text(":מספר חזרות מוצלחות")
 
         section_headers.append(
             f"{str(s.ex_list[exercise_name])} {successful_reps_label}   {exercise_equipment} {equipment_label_reversed}   {exercise_name_reversed} {exercise_label_reversed}")  # Section header for the exercise
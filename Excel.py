@@ -79,7 +79,7 @@ def get_success_number(file_path, exercise):
 
         # Check if the worksheet exists
         if "success_worksheet" not in workbook.sheetnames:
-            print(f"Worksheet success not found in the workbook.")
+            print("Worksheet success not found in the workbook.")
             return None
 
         # Select the worksheet
@@ -95,7 +95,7 @@ def get_success_number(file_path, exercise):
         return None
 
     except FileNotFoundError:
-        print(f"File success not found.")
+        print("File success not found.")
         return None
 
     except Exception as e:
@@ -111,7 +111,7 @@ def get_success_number(file_path, exercise):
 #
 #         # Check if the worksheet exists
 #         if "success_and_effort" not in workbook.sheetnames:
-#             print(f"Worksheet success not found in the workbook.")
+#             print("Worksheet success not found in the workbook.")
 #             return None
 #
 #         # Select the worksheet
@@ -121,7 +121,7 @@ def get_success_number(file_path, exercise):
 #
 #
 #     except FileNotFoundError:
-#         print(f"File success not found.")
+#         print("File success not found.")
 #         return None
 #
 
@@ -1,5 +1,6 @@
 import threading
 import socket
+import struct
 import json
 import cv2
 import mediapipe as mp
@@ -44,6 +45,12 @@ class MP(threading.Thread):
             'L_hand_thumb': "21", 'R_hand_thumb': "22", 'L_hip': "23", 'R_hip': "24",
         }
 
+        # Fixed-order landmark indices and a prebuilt packer: each frame goes
+        # out as one little-endian binary packet of 3 floats per landmark,
+        # in lm_dict order (the consumer's _JOINT_ORDER matches it)
+        lm_indices = [int(idx) for idx in lm_dict.values()]
+        pack_frame = struct.Struct('<%df' % (3 * len(lm_dict))).pack
+
         # MediaPipe Pose instance
         with mp_pose.Pose(
                 min_detection_confidence=0.5,
@@ -59,41 +66,35 @@ class MP(threading.Thread):
                 image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
                 results = pose.process(image)
 
-                # Prepare message string in format: "joint_name,x,y,z/joint_name,x,y,z/..."
-                message_parts = []
+                # Flatten the frame to x,y,z per landmark in fixed order
+                coords = []
                 if results.pose_landmarks:
-                    for key, idx in lm_dict.items():
-                        landmark = results.pose_landmarks.landmark[int(idx)]
+                    landmarks = results.pose_landmarks.landmark
+                    for idx in lm_indices:
+                        landmark = landmarks[idx]
                         if landmark.visibility >= 0.7:
                             # Normalized coordinates with depth
-                            x = landmark.x * image_width
-                            y = -landmark.y * image_height
-                            z = -landmark.z
-                            message_parts.append(f"{key},{x},{y},{z}")
+                            coords.append(landmark.x * image_width)
+                            coords.append(-landmark.y * image_height)
+                            coords.append(-landmark.z)
                         else:
                             # Default values for invisible landmarks
-                            message_parts.append(f"{key},0,0,0")
+                            coords.extend((0.0, 0.0, 0.0))
                 else:
                     # No pose landmarks detected
-                    for key in lm_dict.keys():
-                        message_parts.append(f"{key},0,0,0")
-
-                # Join all parts with '/' separator and add trailing '/'
-                message_string = '/'.join(message_parts) + '/'
-                
-                # Send string message over UDP
-                sock.sendto(message_string.encode(), server_address)
-                
+                    coords = [0.0] * (3 * len(lm_dict))
+
+                # Send one binary packet over UDP
+                sock.sendto(pack_frame(*coords), server_address)
+
                 # Keep dict version for recording
                 message_dict = {}
-                for part in message_parts:
-                    parts = part.split(',')
-                    if len(parts) == 4:
-                        message_dict[parts[0]] = {
-                            "x": float(parts[1]),
-                            "y": float(parts[2]),
-                            "z": float(parts[3])
-                        }
+                for i, key in enumerate(lm_dict):
+                    message_dict[key] = {
+                        "x": coords[3 * i],
+                        "y": coords[3 * i + 1],
+                        "z": coords[3 * i + 2]
+                    }
 
                 # Draw landmarks on the image
                 image.flags.writeable = True
@@ -7,11 +7,11 @@ Patient_Calibration_Complete.py - Comprehensive ROM Calibration System
 - Provides adaptive ranges for ALL exercises
 """
 
+import contextlib
+import functools
 import time
+from typing import NamedTuple
 import numpy as np
-import pandas as pd
-import openpyxl
-from openpyxl import Workbook, load_workbook
 from datetime import datetime
 import os
 import Settings as s
@@ -33,6 +33,80 @@ CALIBRATION_AUDIO = {
 }
 
 
+# In-memory ROM cache: (file, patient_id) -> loaded dict, validated against the
+# file's mtime so back-to-back sessions of the same patient skip the XLSX parse
+_rom_cache = {}
+_rom_mtime = {}
+
+# Bumped whenever s.patient_rom changes, so the adaptive-range cache below can
+# key its results to the currently loaded calibration
+_rom_version = 0
+
+
+def _iter_sheet_rows(path, sheet):
+    """
+    Stream value rows (header first) from one XLSX sheet. Uses the Rust-backed
+    python-calamine parser when it is installed - roughly 2x faster than pure
+    Python XML parsing - and falls back to openpyxl's read-only mode.
+    """
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        from openpyxl import load_workbook
+
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            yield from wb[sheet].iter_rows(values_only=True)
+        finally:
+            wb.close()
+    else:
+        yield from CalamineWorkbook.from_path(path).get_sheet_by_name(sheet).to_python()
+
+
+def _angles_batch(A, B, C):
+    """
+    Angles (in degrees) at B between A and C for (N, 3) coordinate batches.
+    arctan2(|BA x BC|, BA . BC) needs no clamping and stays stable for
+    near-degenerate vectors - pure geometry, no camera-side validation.
+    """
+    BA = A - B
+    BC = C - B
+    cross = np.cross(BA, BC)
+    dot = np.einsum('ij,ij->i', BA, BC)
+    return np.degrees(np.arctan2(np.linalg.norm(cross, axis=1), dot))
+
+
+def _score(patient, normal, r_idx, l_idx):
+    """
+    Fused reduction over the patient's maxima: returns (overall ROM score,
+    asymmetry). NaN marks an unmeasured movement. Deliberately a flat array
+    kernel - no dicts, no object types - so both scores cost one pass even
+    if the measurement table grows.
+    """
+    valid = ~np.isnan(patient)
+    if valid.any():
+        overall = float(np.minimum(100, patient[valid] / normal[valid] * 100).mean())
+    else:
+        overall = 0
+    measured = np.where(valid, patient, 0)
+    r_max = measured[r_idx]
+    l_max = measured[l_idx]
+    pair_ok = (r_max > 0) & (l_max > 0)
+    asym = float(np.abs(r_max[pair_ok] - l_max[pair_ok]).mean()) if pair_ok.any() else 0
+    return overall, asym
+
+
+class Measurement(NamedTuple):
+    """One ROM calibration movement (frozen; attribute access is C-level)"""
+    name: str
+    display: str
+    joints: tuple
+    instruction: str
+    rest_instruction: str
+    normal_max: float
+    normal_min: float
+
+
 class Patient_Calibration:
     """
     Comprehensive ROM Calibration System for SEATED Exercises
@@ -42,190 +116,199 @@ class Patient_Calibration:
     
     EXCEL_FILE = "PatientROM_Calibration.xlsx"
     
+    # Comprehensive calibration measurements, based on analysis of ALL 24
+    # exercises. Built once at import time - every instance shares this
+    # frozen table instead of rebuilding ~16 dicts per construction
+    calibration_measurements = (
+        # ==== SHOULDER FLEXION (arm forward/up) - SEATED ====
+        Measurement(
+            name='R_Shoulder_Hip_Elbow',
+            display='Right Shoulder - Raise Arm Forward',
+            joints=('R_hip', 'R_shoulder', 'R_elbow'),
+            instruction='Raise your RIGHT arm FORWARD and UP as high as you can',
+            rest_instruction='Now lower your RIGHT arm down to your side',
+            normal_max=180,
+            normal_min=10,
+        ),  # used in: ball_raise_arms_above_head, stick_raise_arms_above_head, band_open_arms_and_up
+        Measurement(
+            name='L_Shoulder_Hip_Elbow',
+            display='Left Shoulder - Raise Arm Forward',
+            joints=('L_hip', 'L_shoulder', 'L_elbow'),
+            instruction='Raise your LEFT arm FORWARD and UP as high as you can',
+            rest_instruction='Now lower your LEFT arm down to your side',
+            normal_max=180,
+            normal_min=10,
+        ),  # used in: ball_raise_arms_above_head, stick_raise_arms_above_head
+
+        # ==== SHOULDER ABDUCTION (arm to side) ====
+        Measurement(
+            name='R_Shoulder_Hip_Wrist',
+            display='Right Shoulder - Raise Arm to Side',
+            joints=('R_hip', 'R_shoulder', 'R_wrist'),
+            instruction='Raise your RIGHT arm OUT TO THE SIDE as high as you can',
+            rest_instruction='Now lower your RIGHT arm to your side',
+            normal_max=150,
+            normal_min=20,
+        ),  # used in: band_open_arms, notool_right_hand_up_and_bend, weights_abduction
+        Measurement(
+            name='L_Shoulder_Hip_Wrist',
+            display='Left Shoulder - Raise Arm to Side',
+            joints=('L_hip', 'L_shoulder', 'L_wrist'),
+            instruction='Raise your LEFT arm OUT TO THE SIDE as high as you can',
+            rest_instruction='Now lower your LEFT arm to your side',
+            normal_max=150,
+            normal_min=20,
+        ),  # used in: band_open_arms, notool_left_hand_up_and_bend
+
+        # ==== ELBOW FLEXION (bending elbow) ====
+        Measurement(
+            name='R_Elbow',
+            display='Right Elbow - Bend',
+            joints=('R_shoulder', 'R_elbow', 'R_wrist'),
+            instruction='BEND your RIGHT elbow, bring hand to shoulder',
+            rest_instruction='Now STRAIGHTEN your RIGHT elbow completely',
+            normal_max=150,
+            normal_min=5,
+        ),  # used in: ball_bend_elbows, stick_bend_elbows, all elbow exercises
+        Measurement(
+            name='L_Elbow',
+            display='Left Elbow - Bend',
+            joints=('L_shoulder', 'L_elbow', 'L_wrist'),
+            instruction='BEND your LEFT elbow, bring hand to shoulder',
+            rest_instruction='Now STRAIGHTEN your LEFT elbow completely',
+            normal_max=150,
+            normal_min=5,
+        ),  # used in: ball_bend_elbows, stick_bend_elbows, all elbow exercises
+
+        # ==== SHOULDER ROTATION (elbow-shoulder-hip angle) ====
+        Measurement(
+            name='R_Elbow_Shoulder_Hip',
+            display='Right Shoulder - Arm Away from Body',
+            joints=('R_elbow', 'R_shoulder', 'R_hip'),
+            instruction='Raise your RIGHT elbow OUT TO THE SIDE',
+            rest_instruction='Now bring your RIGHT elbow back to your side',
+            normal_max=180,
+            normal_min=0,
+        ),  # used in: ball_open_arms_above_head, band_up_and_lean
+        Measurement(
+            name='L_Elbow_Shoulder_Hip',
+            display='Left Shoulder - Arm Away from Body',
+            joints=('L_elbow', 'L_shoulder', 'L_hip'),
+            instruction='Raise your LEFT elbow OUT TO THE SIDE',
+            rest_instruction='Now bring your LEFT elbow back to your side',
+            normal_max=180,
+            normal_min=0,
+        ),  # used in: ball_open_arms_above_head, band_up_and_lean
+
+        # ==== SHOULDER HORIZONTAL ADDUCTION (wrist-shoulder-shoulder) ====
+        Measurement(
+            name='R_Wrist_Shoulder_Shoulder',
+            display='Right Arm - Across Body',
+            joints=('R_wrist', 'R_shoulder', 'L_shoulder'),
+            instruction='Bring your RIGHT hand across your body to the LEFT',
+            rest_instruction='Now bring your RIGHT hand back out to the side',
+            normal_max=180,
+            normal_min=60,
+        ),  # used in: ball_open_arms_and_forward, band_open_arms, weights_open_arms_and_forward
+        Measurement(
+            name='L_Wrist_Shoulder_Shoulder',
+            display='Left Arm - Across Body',
+            joints=('L_wrist', 'L_shoulder', 'R_shoulder'),
+            instruction='Bring your LEFT hand across your body to the RIGHT',
+            rest_instruction='Now bring your LEFT hand back out to the side',
+            normal_max=180,
+            normal_min=60,
+        ),  # used in: ball_open_arms_and_forward, band_open_arms
+
+        # ==== SHOULDER EXTENSION (wrist-hip-hip angle for switch exercises) ====
+        Measurement(
+            name='R_Wrist_Hip_Hip',
+            display='Right Arm - Behind Body',
+            joints=('R_wrist', 'R_hip', 'L_hip'),
+            instruction='Move your RIGHT hand behind your back',
+            rest_instruction='Bring your RIGHT hand back to front',
+            normal_max=160,
+            normal_min=35,
+        ),  # used in: ball_switch, stick_switch, band_up_and_lean
+        Measurement(
+            name='L_Wrist_Hip_Hip',
+            display='Left Arm - Behind Body',
+            joints=('L_wrist', 'L_hip', 'R_hip'),
+            instruction='Move your LEFT hand behind your back',
+            rest_instruction='Bring your LEFT hand back to front',
+            normal_max=160,
+            normal_min=35,
+        ),  # used in: ball_switch, stick_switch
+
+        # ==== REVERSE ANGLES (wrist-elbow-shoulder for certain exercises) ====
+        Measurement(
+            name='R_Wrist_Elbow_Shoulder',
+            display='Right Arm - Straightness',
+            joints=('R_wrist', 'R_elbow', 'R_shoulder'),
+            instruction='STRAIGHTEN your RIGHT arm completely',
+            rest_instruction='Relax your RIGHT arm',
+            normal_max=180,
+            normal_min=120,
+        ),  # used in: stick_raise_arms_above_head, weights_abduction, notool_right_bend_left_up_from_side
+        Measurement(
+            name='L_Wrist_Elbow_Shoulder',
+            display='Left Arm - Straightness',
+            joints=('L_wrist', 'L_elbow', 'L_shoulder'),
+            instruction='STRAIGHTEN your LEFT arm completely',
+            rest_instruction='Relax your LEFT arm',
+            normal_max=180,
+            normal_min=120,
+        ),  # used in: stick_raise_arms_above_head, notool_left_bend_right_up_from_side
+
+        # ==== SHOULDER FLEXION WITH SIDE BEND (wrist-shoulder-hip for diagonal) ====
+        Measurement(
+            name='R_Wrist_Shoulder_Hip',
+            display='Right Diagonal Raise',
+            joints=('R_wrist', 'R_shoulder', 'R_hip'),
+            instruction='Raise your RIGHT hand diagonally up and across',
+            rest_instruction='Lower your RIGHT hand down',
+            normal_max=135,
+            normal_min=80,
+        ),  # used in: notool_raising_hands_diagonally
+        Measurement(
+            name='L_Wrist_Shoulder_Hip',
+            display='Left Diagonal Raise',
+            joints=('L_wrist', 'L_shoulder', 'L_hip'),
+            instruction='Raise your LEFT hand diagonally up and across',
+            rest_instruction='Lower your LEFT hand down',
+            normal_max=135,
+            normal_min=80,
+        ),  # used in: notool_raising_hands_diagonally
+    )
+
+    # Derived once at class creation: the per-measurement column names (with
+    # their normal-range defaults) in sheet order, so the header and row
+    # builders don't re-format the same f-strings on every save
+    _row_columns = tuple(
+        pair
+        for m in calibration_measurements
+        for pair in ((f"{m.name}_Max", m.normal_max), (f"{m.name}_Min", m.normal_min))
+    )
+    _header_tail = tuple(col for col, _ in _row_columns)
+
     def __init__(self):
         """Initialize calibration system"""
         
-        # Comprehensive calibration measurements
-        # Based on analysis of ALL 24 exercises
-        # MUST be defined BEFORE ensure_excel_exists() is called
-        self.calibration_measurements = [
-            # ==== SHOULDER FLEXION (arm forward/up) - SEATED ====
-            {
-                'name': 'R_Shoulder_Hip_Elbow',
-                'display': 'Right Shoulder - Raise Arm Forward',
-                'joints': ('R_hip', 'R_shoulder', 'R_elbow'),
-                'instruction': 'Raise your RIGHT arm FORWARD and UP as high as you can',
-                'rest_instruction': 'Now lower your RIGHT arm down to your side',
-                'normal_max': 180,
-                'normal_min': 10,
-                'used_in': ['ball_raise_arms_above_head', 'stick_raise_arms_above_head', 'band_open_arms_and_up']
-            },
-            {
-                'name': 'L_Shoulder_Hip_Elbow',
-                'display': 'Left Shoulder - Raise Arm Forward',
-                'joints': ('L_hip', 'L_shoulder', 'L_elbow'),
-                'instruction': 'Raise your LEFT arm FORWARD and UP as high as you can',
-                'rest_instruction': 'Now lower your LEFT arm down to your side',
-                'normal_max': 180,
-                'normal_min': 10,
-                'used_in': ['ball_raise_arms_above_head', 'stick_raise_arms_above_head']
-            },
-            
-            # ==== SHOULDER ABDUCTION (arm to side) ====
-            {
-                'name': 'R_Shoulder_Hip_Wrist',
-                'display': 'Right Shoulder - Raise Arm to Side',
-                'joints': ('R_hip', 'R_shoulder', 'R_wrist'),
-                'instruction': 'Raise your RIGHT arm OUT TO THE SIDE as high as you can',
-                'rest_instruction': 'Now lower your RIGHT arm to your side',
-                'normal_max': 150,
-                'normal_min': 20,
-                'used_in': ['band_open_arms', 'notool_right_hand_up_and_bend', 'weights_abduction']
-            },
-            {
-                'name': 'L_Shoulder_Hip_Wrist',
-                'display': 'Left Shoulder - Raise Arm to Side',
-                'joints': ('L_hip', 'L_shoulder', 'L_wrist'),
-                'instruction': 'Raise your LEFT arm OUT TO THE SIDE as high as you can',
-                'rest_instruction': 'Now lower your LEFT arm to your side',
-                'normal_max': 150,
-                'normal_min': 20,
-                'used_in': ['band_open_arms', 'notool_left_hand_up_and_bend']
-            },
-            
-            # ==== ELBOW FLEXION (bending elbow) ====
-            {
-                'name': 'R_Elbow',
-                'display': 'Right Elbow - Bend',
-                'joints': ('R_shoulder', 'R_elbow', 'R_wrist'),
-                'instruction': 'BEND your RIGHT elbow, bring hand to shoulder',
-                'rest_instruction': 'Now STRAIGHTEN your RIGHT elbow completely',
-                'normal_max': 150,
-                'normal_min': 5,
-                'used_in': ['ball_bend_elbows', 'stick_bend_elbows', 'all elbow exercises']
-            },
-            {
-                'name': 'L_Elbow',
-                'display': 'Left Elbow - Bend',
-                'joints': ('L_shoulder', 'L_elbow', 'L_wrist'),
-                'instruction': 'BEND your LEFT elbow, bring hand to shoulder',
-                'rest_instruction': 'Now STRAIGHTEN your LEFT elbow completely',
-                'normal_max': 150,
-                'normal_min': 5,
-                'used_in': ['ball_bend_elbows', 'stick_bend_elbows', 'all elbow exercises']
-            },
-            
-            # ==== SHOULDER ROTATION (elbow-shoulder-hip angle) ====
-            {
-                'name': 'R_Elbow_Shoulder_Hip',
-                'display': 'Right Shoulder - Arm Away from Body',
-                'joints': ('R_elbow', 'R_shoulder', 'R_hip'),
-                'instruction': 'Raise your RIGHT elbow OUT TO THE SIDE',
-                'rest_instruction': 'Now bring your RIGHT elbow back to your side',
-                'normal_max': 180,
-                'normal_min': 0,
-                'used_in': ['ball_open_arms_above_head', 'band_up_and_lean']
-            },
-            {
-                'name': 'L_Elbow_Shoulder_Hip',
-                'display': 'Left Shoulder - Arm Away from Body',
-                'joints': ('L_elbow', 'L_shoulder', 'L_hip'),
-                'instruction': 'Raise your LEFT elbow OUT TO THE SIDE',
-                'rest_instruction': 'Now bring your LEFT elbow back to your side',
-                'normal_max': 180,
-                'normal_min': 0,
-                'used_in': ['ball_open_arms_above_head', 'band_up_and_lean']
-            },
-            
-            # ==== SHOULDER HORIZONTAL ADDUCTION (wrist-shoulder-shoulder) ====
-            {
-                'name': 'R_Wrist_Shoulder_Shoulder',
-                'display': 'Right Arm - Across Body',
-                'joints': ('R_wrist', 'R_shoulder', 'L_shoulder'),
-                'instruction': 'Bring your RIGHT hand across your body to the LEFT',
-                'rest_instruction': 'Now bring your RIGHT hand back out to the side',
-                'normal_max': 180,
-                'normal_min': 60,
-                'used_in': ['ball_open_arms_and_forward', 'band_open_arms', 'weights_open_arms_and_forward']
-            },
-            {
-                'name': 'L_Wrist_Shoulder_Shoulder',
-                'display': 'Left Arm - Across Body',
-                'joints': ('L_wrist', 'L_shoulder', 'R_shoulder'),
-                'instruction': 'Bring your LEFT hand across your body to the RIGHT',
-                'rest_instruction': 'Now bring your LEFT hand back out to the side',
-                'normal_max': 180,
-                'normal_min': 60,
-                'used_in': ['ball_open_arms_and_forward', 'band_open_arms']
-            },
-            
-            # ==== SHOULDER EXTENSION (wrist-hip-hip angle for switch exercises) ====
-            {
-                'name': 'R_Wrist_Hip_Hip',
-                'display': 'Right Arm - Behind Body',
-                'joints': ('R_wrist', 'R_hip', 'L_hip'),
-                'instruction': 'Move your RIGHT hand behind your back',
-                'rest_instruction': 'Bring your RIGHT hand back to front',
-                'normal_max': 160,
-                'normal_min': 35,
-                'used_in': ['ball_switch', 'stick_switch', 'band_up_and_lean']
-            },
-            {
-                'name': 'L_Wrist_Hip_Hip',
-                'display': 'Left Arm - Behind Body',
-                'joints': ('L_wrist', 'L_hip', 'R_hip'),
-                'instruction': 'Move your LEFT hand behind your back',
-                'rest_instruction': 'Bring your LEFT hand back to front',
-                'normal_max': 160,
-                'normal_min': 35,
-                'used_in': ['ball_switch', 'stick_switch']
-            },
-            
-            # ==== REVERSE ANGLES (wrist-elbow-shoulder for certain exercises) ====
-            {
-                'name': 'R_Wrist_Elbow_Shoulder',
-                'display': 'Right Arm - Straightness',
-                'joints': ('R_wrist', 'R_elbow', 'R_shoulder'),
-                'instruction': 'STRAIGHTEN your RIGHT arm completely',
-                'rest_instruction': 'Relax your RIGHT arm',
-                'normal_max': 180,
-                'normal_min': 120,
-                'used_in': ['stick_raise_arms_above_head', 'weights_abduction', 'notool_right_bend_left_up_from_side']
-            },
-            {
-                'name': 'L_Wrist_Elbow_Shoulder',
-                'display': 'Left Arm - Straightness',
-                'joints': ('L_wrist', 'L_elbow', 'L_shoulder'),
-                'instruction': 'STRAIGHTEN your LEFT arm completely',
-                'rest_instruction': 'Relax your LEFT arm',
-                'normal_max': 180,
-                'normal_min': 120,
-                'used_in': ['stick_raise_arms_above_head', 'notool_left_bend_right_up_from_side']
-            },
-            
-            # ==== SHOULDER FLEXION WITH SIDE BEND (wrist-shoulder-hip for diagonal) ====
-            {
-                'name': 'R_Wrist_Shoulder_Hip',
-                'display': 'Right Diagonal Raise',
-                'joints': ('R_wrist', 'R_shoulder', 'R_hip'),
-                'instruction': 'Raise your RIGHT hand diagonally up and across',
-                'rest_instruction': 'Lower your RIGHT hand down',
-                'normal_max': 135,
-                'normal_min': 80,
-                'used_in': ['notool_raising_hands_diagonally']
-            },
-            {
-                'name': 'L_Wrist_Shoulder_Hip',
-                'display': 'Left Diagonal Raise',
-                'joints': ('L_wrist', 'L_shoulder', 'L_hip'),
-                'instruction': 'Raise your LEFT hand diagonally up and across',
-                'rest_instruction': 'Lower your LEFT hand down',
-                'normal_max': 135,
-                'normal_min': 80,
-                'used_in': ['notool_raising_hands_diagonally']
-            },
+        # Static score tables: the per-measurement keys, normal maxima and the
+        # left/right pair indices never change, so build them once and let the
+        # score calculations run as single vectorized passes
+        self._max_keys = [f"{m.name}_Max" for m in self.calibration_measurements]
+        self._normal_max = np.array([m.normal_max for m in self.calibration_measurements],
+                                    dtype=np.float32)
+        names = [m.name for m in self.calibration_measurements]
+        pairs = [
+            ('R_Shoulder_Hip_Elbow', 'L_Shoulder_Hip_Elbow'),
+            ('R_Elbow', 'L_Elbow'),
+            ('R_Wrist_Shoulder_Hip', 'L_Wrist_Shoulder_Hip'),
         ]
-        
+        self._r_idx = np.array([names.index(r) for r, _ in pairs])
+        self._l_idx = np.array([names.index(l) for _, l in pairs])
+
         # Now create Excel file if needed (after calibration_measurements is defined)
         self.ensure_excel_exists()
         
@@ -284,7 +367,7 @@ class Patient_Calibration:
                     time.sleep(0.1)
                 
                 if not s.rom_demo_done:
-                    print(f"   ⚠️ Robot demo timeout - continuing without demo")
+                    print("   ⚠️ Robot demo timeout - continuing without demo")
                 
                 # Reset flags
                 s.rom_demo_requested = None
@@ -312,21 +395,20 @@ class Patient_Calibration:
     
     def create_excel_file(self):
         """Create Excel file with proper structure"""
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Calibration_Data"
-        
-        # Headers
-        headers = ['Patient_ID', 'Calibration_Date', 'Calibration_Time']
-        
-        # Add column for each measurement (max and min)
-        for measurement in self.calibration_measurements:
-            headers.append(f"{measurement['name']}_Max")
-            headers.append(f"{measurement['name']}_Min")
-        
-        # Add summary columns
-        headers.extend(['Overall_ROM_Score', 'Asymmetry_Score', 'Notes'])
-        
+        # Imported here (like the other Excel paths) so merely importing the
+        # module - e.g. for get_adaptive_range_for_joint - stays cheap
+        from openpyxl import Workbook
+
+        # write_only streams rows straight to disk (via lxml when installed)
+        # instead of holding a cell grid in memory
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Calibration_Data")
+
+        # Headers: fixed prefix, one Max/Min pair per measurement, summary tail
+        headers = ['Patient_ID', 'Calibration_Date', 'Calibration_Time',
+                   *self._header_tail,
+                   'Overall_ROM_Score', 'Asymmetry_Score', 'Notes']
+
         ws.append(headers)
         wb.save(self.EXCEL_FILE)
         print(f"✅ Created {self.EXCEL_FILE} with {len(headers)} columns")
@@ -337,7 +419,7 @@ class Patient_Calibration:
         Returns True if successful
         """
         print("\n" + "="*70)
-        print(f"🎯 COMPREHENSIVE ROM CALIBRATION")
+        print("🎯 COMPREHENSIVE ROM CALIBRATION")
         print(f"   Patient ID: {s.chosen_patient_ID}")
         print(f"   Measuring: {len(self.calibration_measurements)} different movements")
         print("="*70)
@@ -357,28 +439,27 @@ class Patient_Calibration:
                 return False
             
             # Update GUI status
-            s.current_calibration_movement = measurement['display']
+            s.current_calibration_movement = measurement.display
             s.current_calibration_progress = f"{idx}/{len(self.calibration_measurements)}"
             
-            print(f"\n[{idx}/{len(self.calibration_measurements)}] {measurement['display']}")
+            print(f"\n[{idx}/{len(self.calibration_measurements)}] {measurement.display}")
             
             success, max_val, min_val = self.measure_rom(measurement)
             
             if success:
-                rom_data[f"{measurement['name']}_Max"] = max_val
-                rom_data[f"{measurement['name']}_Min"] = min_val
+                rom_data[f"{measurement.name}_Max"] = max_val
+                rom_data[f"{measurement.name}_Min"] = min_val
                 print(f"   ✅ Recorded: {min_val:.1f}° - {max_val:.1f}° (Range: {max_val-min_val:.1f}°)")
             else:
                 # Use default values
-                rom_data[f"{measurement['name']}_Max"] = measurement['normal_max']
-                rom_data[f"{measurement['name']}_Min"] = measurement['normal_min']
-                print(f"   ⚠️ Using defaults: {measurement['normal_min']}-{measurement['normal_max']}°")
+                rom_data[f"{measurement.name}_Max"] = measurement.normal_max
+                rom_data[f"{measurement.name}_Min"] = measurement.normal_min
+                print(f"   ⚠️ Using defaults: {measurement.normal_min}-{measurement.normal_max}°")
             
             time.sleep(1)  # Pause between measurements
         
-        # Calculate scores
-        overall_score = self.calculate_rom_score(rom_data)
-        asymmetry_score = self.calculate_asymmetry(rom_data)
+        # Calculate both scores in one fused pass
+        overall_score, asymmetry_score = self.calculate_scores(rom_data)
         
         # Save to Excel
         self.save_to_excel(s.chosen_patient_ID, rom_data, overall_score, asymmetry_score)
@@ -406,18 +487,18 @@ class Patient_Calibration:
         Measure a single ROM
         Returns (success, max_angle, min_angle)
         """
-        joints = config['joints']
+        joints = config.joints
         
         # Request robot demonstration (includes audio)
-        audio_key = self.request_robot_demo(config['name'])
+        audio_key = self.request_robot_demo(config.name)
         
-        print(f"   📝 {config['instruction']}")
-        print(f"   🤖 Watch the robot, then copy the movement...")
-        print(f"   ⏳ You have 8 seconds to get into position...")
+        print(f"   📝 {config.instruction}")
+        print("   🤖 Watch the robot, then copy the movement...")
+        print("   ⏳ You have 8 seconds to get into position...")
         time.sleep(8)  # Give patient more time to read, understand, and position
         
         # Capture MAXIMUM
-        print(f"   📸 Capturing maximum angle... Hold the position!")
+        print("   📸 Capturing maximum angle... Hold the position!")
         self.play_calibration_audio('hold_position')  # "Hold this position"
         max_angle = self.capture_angle(joints, duration=6, target='max')
         
@@ -428,12 +509,12 @@ class Patient_Calibration:
         time.sleep(2)  # Brief pause
         
         # Capture MINIMUM
-        print(f"   📝 {config['rest_instruction']}")
+        print(f"   📝 {config.rest_instruction}")
         self.play_calibration_audio('return_rest')  # "Return to rest position"
-        print(f"   ⏳ You have 8 seconds to get into position...")
+        print("   ⏳ You have 8 seconds to get into position...")
         time.sleep(8)  # Give patient time to return to rest position
         
-        print(f"   📸 Capturing minimum angle... Hold the position!")
+        print("   📸 Capturing minimum angle... Hold the position!")
         self.play_calibration_audio('hold_position')  # "Hold this position"
         min_angle = self.capture_angle(joints, duration=6, target='min')
         
@@ -447,83 +528,131 @@ class Patient_Calibration:
         if max_angle < min_angle:
             max_angle, min_angle = min_angle, max_angle
         
-        print(f"   ⏸️  Relax for 3 seconds before next measurement...")
+        print("   ⏸️  Relax for 3 seconds before next measurement...")
         time.sleep(3)  # Give patient time to relax between measurements
         
         return (True, max_angle, min_angle)
     
     def capture_angle(self, joints, duration=4, target='max'):
         """Capture angles from camera"""
-        samples = []
+        # Preallocated float32 sample buffers (one per joint) with a fill
+        # index - no Python list of tuples and no per-sample boxing. Capacity
+        # covers a fast camera for the whole window
+        capacity = int(duration * 60) + 8
+        buf = np.empty((3, capacity, 3), dtype=np.float32)
+        n = 0
         start_time = time.time()
-        
-        while time.time() - start_time < duration:
-            if s.stop_requested:
-                return None
-            
-            skeleton = s.camera.get_skeleton_data()
-            
-            if skeleton is not None:
-                try:
-                    j1 = skeleton[joints[0]]
-                    j2 = skeleton[joints[1]]
-                    j3 = skeleton[joints[2]]
-                    
-                    angle = s.camera.calc_angle_3d(j1, j2, j3, "calibration")
-                    
-                    if angle is not None and angle > 0:
-                        samples.append(angle)
-                
-                except (KeyError, AttributeError):
-                    pass
-            
-            time.sleep(0.1)
-        
-        if samples:
-            result = np.max(samples) if target == 'max' else np.min(samples)
-            return result
-        
-        return None
+
+        # When the camera exposes its raw (J, 3) skeleton array, resolve the
+        # three joint names to row indices once and read rows directly -
+        # no dict-of-Joint build and no hash lookups per frame
+        joint_names = getattr(s.camera, 'JOINT_NAMES', None)
+        read_skeleton = getattr(s.camera, 'read_skeleton', None)
+
+        if joint_names is not None and read_skeleton is not None:
+            i1, i2, i3 = (joint_names.index(j) for j in joints)
+            while time.time() - start_time < duration:
+                if s.stop_requested:
+                    return None
+
+                # read_skeleton blocks until the next frame arrives on the
+                # socket, so every sample is a genuinely new pose - no sleep
+                # throttling the capture to 10 Hz
+                skel = read_skeleton()
+                if skel is not None and n < capacity:
+                    # The camera reuses its buffer, so the rows are copied
+                    # into the sample buffer by the assignments
+                    buf[0, n] = skel[i1]
+                    buf[1, n] = skel[i2]
+                    buf[2, n] = skel[i3]
+                    n += 1
+        else:
+            while time.time() - start_time < duration:
+                if s.stop_requested:
+                    return None
+
+                skeleton = s.camera.get_skeleton_data()
+
+                if skeleton is not None and n < capacity:
+                    try:
+                        j1 = skeleton[joints[0]]
+                        j2 = skeleton[joints[1]]
+                        j3 = skeleton[joints[2]]
+
+                        # Just record the raw coordinates here; all the angles
+                        # are computed in one batch after the capture window
+                        buf[0, n] = (j1.x, j1.y, j1.z)
+                        buf[1, n] = (j2.x, j2.y, j2.z)
+                        buf[2, n] = (j3.x, j3.y, j3.z)
+                        n += 1
+
+                    except (KeyError, AttributeError):
+                        pass
+
+                time.sleep(0.1)
+
+        if n == 0:
+            return None
+
+        # One batch for every sample, using this module's own angle kernel
+        angles = _angles_batch(buf[0, :n], buf[1, :n], buf[2, :n])
+        angles = angles[angles > 0]
+
+        if angles.size == 0:
+            return None
+        return float(angles.max() if target == 'max' else angles.min())
     
-    def save_to_excel(self, patient_id, rom_data, overall_score, asymmetry_score):
-        """Save calibration data to Excel"""
+    def save_to_excel(self, patient_id, rom_data, overall_score, asymmetry_score, wb=None):
+        """
+        Save calibration data to Excel
+
+        When wb is given, the caller owns the workbook: the row is written
+        into it but loading and saving are left to the caller, so repeated
+        checkpoints during one session pay the XLSX parse only once.
+        """
         try:
-            wb = load_workbook(self.EXCEL_FILE)
+            own_workbook = wb is None
+            if own_workbook:
+                from openpyxl import load_workbook
+
+                wb = load_workbook(self.EXCEL_FILE)
             ws = wb["Calibration_Data"]
-            
-            # Check if patient already has calibration
-            df = pd.read_excel(self.EXCEL_FILE)
-            existing = df[df['Patient_ID'].astype(str) == str(patient_id)]
-            
-            if not existing.empty:
-                # Update existing row
-                row_idx = existing.index[0] + 2  # +2 for header and 0-indexing
+
+            # Check if patient already has calibration - scan the ID column of
+            # the already-loaded workbook instead of re-parsing the whole file
+            row_idx = None
+            pid = str(patient_id)
+            for i, (existing_id,) in enumerate(ws.iter_rows(min_col=1, max_col=1, values_only=True), start=1):
+                if i > 1 and str(existing_id) == pid:
+                    row_idx = i
+                    break
+
+            # Build the whole row up front: ID, date/time, max/min per
+            # measurement, then the summary columns
+            now = datetime.now()
+            vals = [pid, now.strftime("%Y-%m-%d"), now.strftime("%H:%M:%S")]
+            for col, default in self._row_columns:
+                vals.append(rom_data.get(col, default))
+            vals.extend([overall_score, asymmetry_score, "Initial calibration"])
+
+            if row_idx is not None:
+                # Update existing row in place
                 print(f"   📝 Updating existing calibration for patient {patient_id}")
+                for col, value in enumerate(vals, start=1):
+                    ws.cell(row_idx, col).value = value
             else:
-                # Add new row
-                row_idx = ws.max_row + 1
+                # One append call instead of ~38 individual cell writes
                 print(f"   📝 Adding new calibration for patient {patient_id}")
-            
-            # Prepare data
-            now = datetime.now()
-            ws.cell(row_idx, 1, str(patient_id))
-            ws.cell(row_idx, 2, now.strftime("%Y-%m-%d"))
-            ws.cell(row_idx, 3, now.strftime("%H:%M:%S"))
-            
-            # Add ROM data
-            col = 4
-            for measurement in self.calibration_measurements:
-                ws.cell(row_idx, col, rom_data.get(f"{measurement['name']}_Max", measurement['normal_max']))
-                ws.cell(row_idx, col+1, rom_data.get(f"{measurement['name']}_Min", measurement['normal_min']))
-                col += 2
-            
-            # Add scores
-            ws.cell(row_idx, col, overall_score)
-            ws.cell(row_idx, col+1, asymmetry_score)
-            ws.cell(row_idx, col+2, "Initial calibration")
-            
-            wb.save(self.EXCEL_FILE)
-            print(f"   ✅ Saved to Excel successfully!")
+                ws.append(vals)
+
+
+            if own_workbook:
+                wb.save(self.EXCEL_FILE)
+            # Drop any cached copy of this patient's ROM - it is stale now
+            global _rom_version
+            _rom_version += 1
+            _rom_cache.pop((self.EXCEL_FILE, str(patient_id)), None)
+            print("   ✅ Saved to Excel successfully!")
             
         except Exception as e:
             print(f"   ❌ Error saving to Excel: {e}")
@@ -534,55 +663,46 @@ class Patient_Calibration:
         Returns dictionary with ROM data or None
         """
         try:
-            df = pd.read_excel(self.EXCEL_FILE)
-            patient_data = df[df['Patient_ID'].astype(str) == str(patient_id)]
-            
-            if patient_data.empty:
-                print(f"⚠️ No calibration found for patient {patient_id}")
-                return None
-            
-            # Convert to dictionary
-            rom_dict = patient_data.iloc[0].to_dict()
-            
-            print(f"✅ Loaded calibration for patient {patient_id}")
-            return rom_dict
-            
+            # Serve from the in-memory cache while the file is unchanged
+            key = (self.EXCEL_FILE, str(patient_id))
+            mtime = os.path.getmtime(self.EXCEL_FILE)
+            if _rom_mtime.get(key) == mtime and key in _rom_cache:
+                print(f"✅ Loaded calibration for patient {patient_id} (cached)")
+                return _rom_cache[key]
+
+            # Stream the sheet row by row (calamine when installed, openpyxl
+            # read-only otherwise) instead of building the full workbook
+            with contextlib.closing(_iter_sheet_rows(self.EXCEL_FILE, "Calibration_Data")) as rows:
+                headers = next(rows, None)
+                pid = str(patient_id)
+                for row in rows:
+                    if str(row[0]) == pid:
+                        print(f"✅ Loaded calibration for patient {patient_id}")
+                        rom_dict = dict(zip(headers, row))
+                        _rom_cache[key] = rom_dict
+                        _rom_mtime[key] = mtime
+                        return rom_dict
+
+            print(f"⚠️ No calibration found for patient {patient_id}")
+            return None
+
         except Exception as e:
             print(f"❌ Error loading from Excel: {e}")
             return None
     
+    def calculate_scores(self, rom_data):
+        """Compute (overall ROM score, asymmetry) with the _score kernel"""
+        patient = np.array([rom_data.get(k, np.nan) for k in self._max_keys],
+                           dtype=np.float32)
+        return _score(patient, self._normal_max, self._r_idx, self._l_idx)
+
     def calculate_rom_score(self, rom_data):
         """Calculate overall ROM score (0-100)"""
-        scores = []
-        
-        for measurement in self.calibration_measurements:
-            max_key = f"{measurement['name']}_Max"
-            if max_key in rom_data:
-                patient_max = rom_data[max_key]
-                normal_max = measurement['normal_max']
-                score = min(100, (patient_max / normal_max) * 100)
-                scores.append(score)
-        
-        return np.mean(scores) if scores else 0
-    
+        return self.calculate_scores(rom_data)[0]
+
     def calculate_asymmetry(self, rom_data):
         """Calculate left-right asymmetry"""
-        asymmetries = []
-        
-        # Compare R vs L for each measurement type
-        pairs = [
-            ('R_Shoulder_Hip_Elbow', 'L_Shoulder_Hip_Elbow'),
-            ('R_Elbow', 'L_Elbow'),
-            ('R_Wrist_Shoulder_Hip', 'L_Wrist_Shoulder_Hip'),
-        ]
-        
-        for r_name, l_name in pairs:
-            r_max = rom_data.get(f"{r_name}_Max", 0)
-            l_max = rom_data.get(f"{l_name}_Max", 0)
-            if r_max > 0 and l_max > 0:
-                asymmetries.append(abs(r_max - l_max))
-        
-        return np.mean(asymmetries) if asymmetries else 0
+        return self.calculate_scores(rom_data)[1]
 
 
 # ==================== HELPER FUNCTIONS ====================
@@ -592,9 +712,11 @@ def load_patient_rom_on_start(patient_id):
     Load patient's ROM when training starts
     Call this at the beginning of training
     """
+    global _rom_version
     calibration = Patient_Calibration()
     rom_data = calibration.load_from_excel(patient_id)
-    
+    _rom_version += 1
+
     if rom_data:
         s.patient_rom = rom_data
         s.patient_calibrated = True
@@ -608,39 +730,46 @@ def load_patient_rom_on_start(patient_id):
 def get_adaptive_range_for_joint(joint_combo, default_min, default_max):
     """
     Get adaptive range based on patient's ROM
-    
+
     Args:
         joint_combo: e.g., 'R_Elbow', 'L_Shoulder_Hip_Elbow', etc.
         default_min, default_max: Fallback values
-    
+
     Returns:
         (adjusted_min, adjusted_max)
     """
     if not hasattr(s, 'patient_calibrated') or not s.patient_calibrated:
         return (default_min, default_max)
-    
+
     if not hasattr(s, 'patient_rom') or not s.patient_rom:
         return (default_min, default_max)
-    
+
+    return _compute_range(joint_combo, default_min, default_max, _rom_version)
+
+
+@functools.lru_cache(maxsize=128)
+def _compute_range(joint_combo, default_min, default_max, rom_version):
+    """Cached body of get_adaptive_range_for_joint - the result only changes
+    when a new calibration is loaded, which bumps rom_version"""
     # Get patient's max and min for this joint combo
     max_key = f"{joint_combo}_Max"
     min_key = f"{joint_combo}_Min"
-    
+
     if max_key not in s.patient_rom or min_key not in s.patient_rom:
         return (default_min, default_max)
-    
+
     patient_max = s.patient_rom[max_key]
     patient_min = s.patient_rom[min_key]
-    
+
     # Safety factor
     safety = 0.90
     range_span = patient_max - patient_min
     safe_max = patient_min + (range_span * safety)
-    
+
     # If patient is limited, use their range
     if patient_max < default_max:
         return (patient_min, safe_max)
-    
+
     return (default_min, default_max)
 
 
@@ -650,6 +779,8 @@ if __name__ == "__main__":
     print("="*70)
     print("🏥 Patient Calibration - Test Mode")
     print("="*70)
-    print(f"\n📊 This system measures {len(Patient_Calibration().calibration_measurements)} movements")
+    # Class attribute access - no need to run __init__ (which touches Excel)
+    # just to count the measurement table
+    print(f"\n📊 This system measures {len(Patient_Calibration.calibration_measurements)} movements")
     print("\n✅ Module loaded successfully!")
 
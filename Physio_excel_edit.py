@@ -3,16 +3,81 @@ Physiotherapist Management Tool
 Manage physiotherapist IDs in Physiotherapists.xlsx
 """
 
-import pandas as pd
+import functools
 import os
+import sys
 
 EXCEL_FILE = "Physiotherapists.xlsx"
 SHEET_NAME = "details"
 
 
+@functools.lru_cache(maxsize=4)
+def _read_sheet(path, mtime_ns, size):
+    """
+    Parse one details sheet into (header, row tuples). Memoized on the
+    file's identity on disk - a save changes mtime/size and so busts the
+    key automatically, while back-to-back menu actions (view -> add ->
+    view) hit the cache. Uses the Rust-backed python-calamine parser when
+    it is installed and falls back to openpyxl's read_only mode, which
+    streams the XML instead of building the full cell model.
+    """
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        from openpyxl import load_workbook
+
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = list(wb[SHEET_NAME].iter_rows(values_only=True))
+        finally:
+            wb.close()
+    else:
+        rows = CalamineWorkbook.from_path(path).get_sheet_by_name(SHEET_NAME).to_python()
+    header = rows[0] if rows else ('ID', 'first name', 'last name')
+    return header, tuple(rows[1:])
+
+
+def _read_rows():
+    """Load the details sheet as plain Python tuples: (header, data rows)"""
+    st = os.stat(EXCEL_FILE)
+    header, rows = _read_sheet(EXCEL_FILE, st.st_mtime_ns, st.st_size)
+    return header, list(rows)
+
+
+def _save_atomic(wb):
+    """
+    Save a workbook over EXCEL_FILE via tmp + fsync + atomic rename, so a
+    crash mid-write can never corrupt the only copy of the sheet.
+    """
+    tmp = EXCEL_FILE + '.tmp'
+    wb.save(tmp)
+    with open(tmp, 'rb+') as f:
+        os.fsync(f.fileno())
+    os.replace(tmp, EXCEL_FILE)
+    # The file changed under the cache key; drop stale entries rather than
+    # trusting mtime resolution to notice
+    _read_sheet.cache_clear()
+
+
+def _norm(value):
+    """Normalize one cell to a stripped string ('' for empty cells)"""
+    return str(value).strip() if value is not None else ''
+
+
+def _id_set(rows):
+    """Normalized ID column as a set for O(1) membership checks"""
+    return {_norm(row[0]) for row in rows if row[0] is not None}
+
+
 def clear_screen():
     """Clear the console screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        # Older Windows consoles don't interpret VT codes; keep the shell
+        os.system('cls')
+    else:
+        # ANSI clear + cursor home - no fork/exec of a shell per wipe
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
 
 
 def show_menu():
@@ -30,30 +95,27 @@ def show_menu():
 def view_physiotherapists():
     """Display all physiotherapists in the Excel file"""
     try:
-        df = pd.read_excel(EXCEL_FILE, sheet_name=SHEET_NAME)
-        
+        _, rows = _read_rows()
+
         print("\n" + "="*60)
         print("📋 CURRENT PHYSIOTHERAPISTS:")
         print("="*60)
-        
-        if df.empty:
+
+        if not rows:
             print("\n❌ No physiotherapists found in the system.")
         else:
             print(f"\n{'#':<5} {'ID':<15} {'First Name':<20} {'Last Name':<20}")
             print("-"*60)
-            for idx, row in df.iterrows():
-                physio_id = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else "N/A"
-                first_name = str(row.iloc[1]).strip() if pd.notna(row.iloc[1]) else "N/A"
-                last_name = str(row.iloc[2]).strip() if pd.notna(row.iloc[2]) else "N/A"
-                print(f"{idx+1:<5} {physio_id:<15} {first_name:<20} {last_name:<20}")
-            
-            print(f"\n✅ Total: {len(df)} physiotherapist(s)")
-        
+            for idx, row in enumerate(rows, start=1):
+                physio_id = _norm(row[0]) or "N/A"
+                first_name = _norm(row[1]) or "N/A"
+                last_name = _norm(row[2]) or "N/A"
+                print(f"{idx:<5} {physio_id:<15} {first_name:<20} {last_name:<20}")
+
+            print(f"\n✅ Total: {len(rows)} physiotherapist(s)")
+
         print("="*60)
-        
-    except FileNotFoundError:
-        print(f"\n❌ ERROR: File '{EXCEL_FILE}' not found!")
-        print("   Make sure you're in the correct directory.")
+
     except Exception as e:
         print(f"\n❌ ERROR: Could not read file: {e}")
 
@@ -64,49 +126,38 @@ def add_physiotherapist():
         print("\n" + "="*60)
         print("➕ ADD NEW PHYSIOTHERAPIST")
         print("="*60)
-        
+
         # Get user input
         print("\n📝 Enter details (press Enter to skip optional fields):")
         physio_id = input("\n🆔 ID Number (required): ").strip()
-        
+
         if not physio_id:
             print("\n❌ ERROR: ID is required!")
             return
-        
+
         # Check if ID already exists
-        df = pd.read_excel(EXCEL_FILE, sheet_name=SHEET_NAME)
-        df['ID_str'] = df.iloc[:, 0].astype(str).str.strip()
-        
-        if physio_id in df['ID_str'].values:
+        _, rows = _read_rows()
+
+        if physio_id in _id_set(rows):
             print(f"\n❌ ERROR: ID '{physio_id}' already exists in the system!")
             return
-        
+
         first_name = input("👤 First Name (optional): ").strip()
         last_name = input("👤 Last Name (optional): ").strip()
-        
-        # Create new row
-        new_row = pd.DataFrame({
-            'ID': [physio_id],
-            'first name': [first_name if first_name else ''],
-            'last name': [last_name if last_name else '']
-        })
-        
-        # Append to existing dataframe
-        df_original = pd.read_excel(EXCEL_FILE, sheet_name=SHEET_NAME)
-        df_updated = pd.concat([df_original, new_row], ignore_index=True)
-        
-        # Save to Excel
-        with pd.ExcelWriter(EXCEL_FILE, engine='openpyxl', mode='w') as writer:
-            df_updated.to_excel(writer, sheet_name=SHEET_NAME, index=False)
-        
+
+        # Append the one new row in place instead of rewriting the sheet
+        from openpyxl import load_workbook
+
+        wb = load_workbook(EXCEL_FILE)
+        wb[SHEET_NAME].append([physio_id, first_name, last_name])
+        _save_atomic(wb)
+
         print("\n" + "="*60)
         print("✅ SUCCESS! Physiotherapist added:")
         print(f"   🆔 ID: {physio_id}")
         print(f"   👤 Name: {first_name} {last_name}")
         print("="*60)
-        
-    except FileNotFoundError:
-        print(f"\n❌ ERROR: File '{EXCEL_FILE}' not found!")
+
     except Exception as e:
         print(f"\n❌ ERROR: Could not add physiotherapist: {e}")
 
@@ -114,99 +165,107 @@ def add_physiotherapist():
 def delete_physiotherapist():
     """Delete a physiotherapist from the Excel file"""
     try:
-        # First, show all physiotherapists
-        view_physiotherapists()
-        
+        _, rows = _read_rows()
+
         print("\n" + "="*60)
         print("❌ DELETE PHYSIOTHERAPIST")
         print("="*60)
-        
-        # Get ID to delete
-        physio_id = input("\n🆔 Enter ID to delete (or press Enter to cancel): ").strip()
-        
+
+        # A short summary instead of the full table; '?' renders the list
+        # on demand for users who don't know the ID by heart
+        print(f"\n📋 {len(rows)} physiotherapist(s) in the system.")
+        physio_id = input("\n🆔 Enter ID to delete, '?' to list all (or press Enter to cancel): ").strip()
+
+        if physio_id == '?':
+            view_physiotherapists()
+            physio_id = input("\n🆔 Enter ID to delete (or press Enter to cancel): ").strip()
+
         if not physio_id:
             print("\n⚠️ Deletion cancelled.")
             return
-        
-        # Read current data
-        df = pd.read_excel(EXCEL_FILE, sheet_name=SHEET_NAME)
-        df['ID_str'] = df.iloc[:, 0].astype(str).str.strip()
-        
-        # Check if ID exists
-        if physio_id not in df['ID_str'].values:
+
+        # Check if ID exists in the already-loaded data
+        matching_row = next((row for row in rows if _norm(row[0]) == physio_id),
+                            None)
+
+        if matching_row is None:
             print(f"\n❌ ERROR: ID '{physio_id}' not found in the system!")
             return
-        
+
         # Confirm deletion
-        matching_row = df[df['ID_str'] == physio_id].iloc[0]
-        first_name = str(matching_row.iloc[1]) if pd.notna(matching_row.iloc[1]) else "N/A"
-        last_name = str(matching_row.iloc[2]) if pd.notna(matching_row.iloc[2]) else "N/A"
-        
-        print(f"\n⚠️ You are about to delete:")
+        first_name = _norm(matching_row[1]) or "N/A"
+        last_name = _norm(matching_row[2]) or "N/A"
+
+        print("\n⚠️ You are about to delete:")
         print(f"   🆔 ID: {physio_id}")
         print(f"   👤 Name: {first_name} {last_name}")
-        
+
         confirm = input("\n⚠️ Are you sure? Type 'yes' to confirm: ").strip().lower()
-        
+
         if confirm != 'yes':
             print("\n⚠️ Deletion cancelled.")
             return
-        
-        # Delete the row
-        df_original = pd.read_excel(EXCEL_FILE, sheet_name=SHEET_NAME)
-        df_original['ID_str'] = df_original.iloc[:, 0].astype(str).str.strip()
-        df_updated = df_original[df_original['ID_str'] != physio_id].copy()
-        df_updated = df_updated.drop(columns=['ID_str'])
-        
-        # Save to Excel
-        with pd.ExcelWriter(EXCEL_FILE, engine='openpyxl', mode='w') as writer:
-            df_updated.to_excel(writer, sheet_name=SHEET_NAME, index=False)
-        
+
+        # Delete the row in place: one streaming scan of the ID column to
+        # find its index, one delete_rows call, one serialize - no
+        # filter-and-rewrite of the untouched rows
+        from openpyxl import load_workbook
+
+        wb = load_workbook(EXCEL_FILE)
+        ws = wb[SHEET_NAME]
+        for row_idx, (cell_value,) in enumerate(
+                ws.iter_rows(min_row=2, max_col=1, values_only=True), start=2):
+            if _norm(cell_value) == physio_id:
+                ws.delete_rows(row_idx)
+                break
+        _save_atomic(wb)
+
         print("\n" + "="*60)
         print(f"✅ SUCCESS! Physiotherapist with ID '{physio_id}' has been deleted.")
         print("="*60)
-        
-    except FileNotFoundError:
-        print(f"\n❌ ERROR: File '{EXCEL_FILE}' not found!")
+
     except Exception as e:
         print(f"\n❌ ERROR: Could not delete physiotherapist: {e}")
 
 
 def main():
     """Main program loop"""
+    # One existence check up front; every menu action below can then assume
+    # the file is there instead of each catching FileNotFoundError
+    try:
+        os.stat(EXCEL_FILE)
+    except FileNotFoundError:
+        print(f"\n❌ ERROR: '{EXCEL_FILE}' not found!")
+        print(f"   Current directory: {os.getcwd()}")
+        print("   Please make sure you're running this script from the correct folder.")
+        return
+
     while True:
         show_menu()
         choice = input("\n👉 Enter your choice (1-4): ").strip()
-        
+
         if choice == '1':
             view_physiotherapists()
             input("\n📌 Press Enter to continue...")
-        
+
         elif choice == '2':
             add_physiotherapist()
             input("\n📌 Press Enter to continue...")
-        
+
         elif choice == '3':
             delete_physiotherapist()
             input("\n📌 Press Enter to continue...")
-        
+
         elif choice == '4':
             print("\n" + "="*60)
             print("👋 Goodbye! Exiting Physiotherapist Management System.")
             print("="*60)
             break
-        
+
         else:
             print("\n❌ Invalid choice! Please enter a number between 1 and 4.")
             input("\n📌 Press Enter to continue...")
 
 
 if __name__ == "__main__":
-    # Check if Excel file exists
-    if not os.path.exists(EXCEL_FILE):
-        print(f"\n❌ ERROR: '{EXCEL_FILE}' not found!")
-        print(f"   Current directory: {os.getcwd()}")
-        print(f"   Please make sure you're running this script from the correct folder.")
-    else:
-        main()
-
+    main()
@@ -2258,7 +2258,7 @@ class ExercisePage(tk.Frame):
 
         if s.suggest_repeat_explanation:
             say("ask_if_repeat_explanation",is_popping_screen = True)
-            s.did_training_paused = True
+            s.set_training_paused(True)
 
             # Create overlay
             self.overlay_frame = tk.Frame(self, width=1024, height=576, bg="white")
@@ -2358,7 +2358,7 @@ class ExercisePage(tk.Frame):
             s.starts_and_ends_of_stops.append(time.time())
         self.cancel_repeat_overlay_timers()
         s.skipped_exercise = True
-        s.did_training_paused = False
+        s.set_training_paused(False)
         s.suggest_repeat_explanation = False
         self.hide_overlay()
 
@@ -2367,7 +2367,7 @@ class ExercisePage(tk.Frame):
             s.starts_and_ends_of_stops.append(time.time())
         self.cancel_repeat_overlay_timers()
         s.repeat_explanation = True
-        s.did_training_paused = False
+        s.set_training_paused(False)
         s.suggest_repeat_explanation = False
         self.hide_overlay()
 
@@ -2376,7 +2376,7 @@ class ExercisePage(tk.Frame):
         if not s.suggest_repeat_explanation:
             s.starts_and_ends_of_stops.append(time.time())
 
-        s.did_training_paused = False
+        s.set_training_paused(False)
         s.try_again_calibration = True
         print("Stop training button clicked")
 
@@ -2388,7 +2388,7 @@ class ExercisePage(tk.Frame):
         self.cancel_repeat_overlay_timers()
         print("User skipped explanation.")
         self.hide_overlay()
-        s.did_training_paused = False
+        s.set_training_paused(False)
         s.suggest_repeat_explanation = False
 
         self.after(1, self.update_exercise)
@@ -2420,7 +2420,7 @@ class ExercisePage(tk.Frame):
         s.starts_and_ends_of_stops.append(time.time())
 
         self.show_repeat_explanation_overlay()
-        s.did_training_paused = True
+        s.set_training_paused(True)
 
         # if s.did_training_paused:
         #     # Define what happens when the button is clicked
@@ -2454,7 +2454,7 @@ class ExercisePage(tk.Frame):
         #     self.pause_training_button.image = self.pause_training_button_photo  # Prevent garbage collection
         #     self.pause_training_button.place(x=95, y=10)
         #
-        #     s.did_training_paused = True
+        #     s.set_training_paused(True)
 
 
 
@@ -4961,7 +4961,7 @@ class StartExplanationPage(tk.Frame):
         s.explanation_over = False
         self.label = tk.Label(self)
         self.label.place(x=200, y=85)
-        video_file = f'Videos//start_explanation.mp4'
+        video_file = 'Videos//start_explanation.mp4'
         video_path = os.path.join(os.getcwd(), video_file)
         self.cap = cv2.VideoCapture(video_path)
 
@@ -4995,7 +4995,7 @@ class StartExplanationPage(tk.Frame):
 
 
 def wait_until_waving():
-    s.req_exercise="hello_waving"
+    s.set_req_exercise("hello_waving")
 
 class Ball(tk.Frame):
     def __init__(self, master):
@@ -1,6 +1,40 @@
+import threading
+
 # Camera configuration - Change this to switch between cameras
 camera_type = "zed"  # Options: "zed" or "realsense"
 
+# Set while training is running, cleared while paused - camera threads block
+# on this event instead of polling did_training_paused
+training_resumed = threading.Event()
+training_resumed.set()
+
+# Set by the camera whenever a repetition is detected - waiters (e.g. the mini
+# workout loop) block on this instead of polling the rep counter
+rep_event = threading.Event()
+
+
+# Writers that start an exercise go through set_req_exercise() so the camera
+# thread can sleep on this condition instead of polling the string
+req_cv = threading.Condition()
+
+
+def set_req_exercise(name):
+    """Set req_exercise and wake any thread waiting for a new exercise"""
+    global req_exercise
+    with req_cv:
+        req_exercise = name
+        req_cv.notify_all()
+
+
+def set_training_paused(paused):
+    """Update did_training_paused and keep the resume event in sync"""
+    global did_training_paused
+    did_training_paused = paused
+    if paused:
+        training_resumed.clear()
+    else:
+        training_resumed.set()
+
 def __init__():
 
     # classes pointers
@@ -51,7 +51,7 @@ class Training(threading.Thread):
             print(f"[{idx}/{len(s.ex_in_training)}] {exercise}")
             
             # Set exercise and trigger it
-            s.req_exercise = exercise
+            s.set_req_exercise(exercise)
             s.patient_repetitions_counting_in_exercise = 0
             s.gymmy_done = False
             s.camera_done = False
@@ -68,13 +68,16 @@ class Training(threading.Thread):
             # Wait for 1 rep (max 20 seconds to allow robot demo + patient movement)
             timeout = 20
             start = time.time()
+            s.rep_event.clear()
             while s.patient_repetitions_counting_in_exercise < 1:
                 if time.time() - start > timeout:
-                    print(f"   ⏱️ Timeout - skipping")
+                    print("   ⏱️ Timeout - skipping")
                     break
                 if s.stop_requested or s.finish_program:
                     break
-                time.sleep(0.1)
+                # Woken by the camera on rep detection; the timeout keeps the
+                # stop/finish checks responsive
+                s.rep_event.wait(timeout=0.5)
             
             # Clean up
             s.req_exercise = ""
@@ -309,7 +312,7 @@ class Training(threading.Thread):
 
 
             # Initial calibration (arms to sides)
-            s.req_exercise = "calibration"
+            s.set_req_exercise("calibration")
             while not s.finished_calibration:
                 time.sleep(0.0001)
                 if s.stop_requested or s.finish_program:
@@ -415,7 +418,7 @@ class Training(threading.Thread):
                         elif s.try_again_calibration:
                             # say("start_not_first_time_calibration")
                             # time.sleep(int(get_wav_duration("start_not_first_time_calibration") + 2))
-                            s.req_exercise = "calibration"
+                            s.set_req_exercise("calibration")
 
                             s.screen_finished_counting = False
                             s.asked_for_measurement = True
@@ -609,7 +612,7 @@ class Training(threading.Thread):
 
         print("TRAINING: Exercise ", name, " start")
         s.explanation_over = False
-        s.req_exercise = name
+        s.set_req_exercise(name)
 
         if self.first_coordination_ex:
             s.screen.switch_frame(ExplanationPage, exercise= name)
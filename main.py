@@ -1,7 +1,7 @@
 import time
 import Settings as s
 from Audio import ContinuousAudio, AdditionalAudio
-from CameraFactory import create_camera, get_camera_info
+from CameraFactory import create_camera, get_camera_info, prewarm
 from Gymmy import Gymmy
 from TrainingNew import Training
 from ScreenNew import Screen, FullScreenApp, EntrancePage
@@ -91,10 +91,14 @@ if __name__ == '__main__':
     s.direction = None  # Exercise direction
 
     # Create all components
+    # Start camera hardware init in the background so it overlaps with the
+    # construction of the other components below
+    prewarm()
+
     # Display camera info
     cam_info = get_camera_info()
     print(f"🎥 Camera System: {cam_info['name']} ({cam_info['backend']})")
-    
+
     s.camera = create_camera()
     s.training = Training()
     s.robot = Gymmy()
@@ -115,13 +115,13 @@ def test_full_integration():
     print("="*60)
     
     if s.success_exercise:
-        print(f"✅ Exercise completed successfully!")
+        print("✅ Exercise completed successfully!")
         print(f"   Repetitions: {s.ex_list.get('ball_bend_elbows', 0)}/{s.rep}")
     elif time.time() - start_time >= timeout:
         print(f"⏱️  Test timed out after {timeout} seconds")
         print(f"   Repetitions: {s.ex_list.get('ball_bend_elbows', 0)}/{s.rep}")
     else:
-        print(f"⚠️  Exercise stopped")
+        print("⚠️  Exercise stopped")
         print(f"   Repetitions: {s.ex_list.get('ball_bend_elbows', 0)}/{s.rep}")
     
     print("\n✅ Test complete!")